@@ -2,9 +2,24 @@ __version__ = "2.1.0"
 __author__ = "Flask-Admin team"
 __email__ = "contact@palletsproject.com"
 
+import typing as t
 
-from .base import Admin  # noqa: F401
-from .base import AdminIndexView  # noqa: F401
-from .base import BaseView  # noqa: F401
-from .base import expose  # noqa: F401
-from .base import expose_plugview  # noqa: F401
+if t.TYPE_CHECKING:
+    from .base import Admin  # noqa: F401
+    from .base import AdminIndexView  # noqa: F401
+    from .base import BaseView  # noqa: F401
+    from .base import expose  # noqa: F401
+    from .base import expose_plugview  # noqa: F401
+
+# Names imported from `flask_admin.base` on first access, so processes that
+# import a submodule without building the admin do not pay for it
+_lazy_imports = ("Admin", "AdminIndexView", "BaseView", "expose", "expose_plugview")
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _lazy_imports:
+        from . import base
+
+        return getattr(base, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
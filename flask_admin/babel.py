@@ -24,20 +24,79 @@ except ImportError:
         def ngettext(self, singular: str, plural: str, n: int) -> str:
             return singular if n == 1 else plural
 else:
+    import flask_babel
+    from flask import g
+
     from flask_admin import translations
 
-    class CustomDomain(Domain):  # type: ignore[misc]
+    class CachedDomain(Domain):  # type: ignore[misc]
+        """
+        Flask-Babel domain that keeps the loaded catalogs per locale and
+        translations path.
+
+        Resolving the translations for every string looks up the request
+        context several times, which adds up when a list view renders
+        hundreds of labels. Once the locale of the request is known, the
+        catalog is found with a single dictionary lookup instead.
+        """
+
+        def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+            super().__init__(*args, **kwargs)
+            self._catalogs: dict[tuple[t.Any, str | None], t.Any] = {}
+
+        def get_translations_path(self, view: t.Any | None) -> str | None:
+            """
+            Return the extra translations directory used for `view`, if any.
+
+            :param view:
+                Current administrative view or None
+            """
+            return None
+
+        def get_translations(self) -> t.Any:
+            try:
+                state = g._get_current_object()
+            except RuntimeError:
+                return super().get_translations()
+
+            ctx = getattr(state, "_flask_babel", None)
+            locale = getattr(ctx, "babel_locale", None)
+            if locale is None:
+                # Let Flask-Babel select the locale of this request first
+                locale = flask_babel.get_locale()
+
+            key = (
+                locale,
+                self.get_translations_path(getattr(state, "_admin_view", None)),
+            )
+            try:
+                return self._catalogs[key]
+            except KeyError:
+                catalog = self._catalogs[key] = super().get_translations()
+                return catalog
+
+    class CustomDomain(CachedDomain):
         def __init__(self) -> None:
             super().__init__(translations.__path__[0], domain="admin")
+            self._translations_caches: dict[str | None, dict[t.Any, t.Any]] = {}
+
+        def get_translations_path(self, view: t.Any | None) -> str | None:
+            if view is not None:
+                return view.admin.translations_path
+
+            return None
+
+        def get_translations_cache(self, ctx: t.Any) -> dict[t.Any, t.Any]:
+            # Flask-Babel only keys its cache by locale, keep a cache per
+            # translations path so each Admin gets its own catalogs
+            path = self.get_translations_path(get_current_view())
+            return self._translations_caches.setdefault(path, {})
 
         @property
         def translation_directories(self) -> list[str]:
-            view = get_current_view()
-
-            if view is not None:
-                dirname = view.admin.translations_path
-                if dirname is not None:
-                    return [dirname] + super().translation_directories
+            dirname = self.get_translations_path(get_current_view())
+            if dirname is not None:
+                return [dirname] + super().translation_directories
 
             return super().translation_directories
 
@@ -49,7 +108,7 @@ else:
 
     from wtforms.i18n import messages_path
 
-    wtforms_domain = Domain(messages_path(), domain="wtforms")
+    wtforms_domain = CachedDomain(messages_path(), domain="wtforms")
 
     class Translations:  # type: ignore[no-redef]
         """Fixes WTForms translation support and uses wtforms translations"""
@@ -1,16 +1,29 @@
+import gc
+import logging
+import os
 import os.path as op
+import threading
 import typing as t
 import warnings
+from collections import OrderedDict
+from contextlib import nullcontext
 from functools import wraps
 
 from flask import abort
 from flask import current_app
 from flask import Flask
 from flask import g
+from flask import get_flashed_messages
 from flask import render_template
+from flask import request
+from flask import Response
+from flask import stream_with_context
 from flask import url_for
 from flask.views import MethodView
 from flask.views import View
+from jinja2 import BytecodeCache
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import TemplateNotFound
 from markupsafe import Markup
 
 from flask_admin import babel
@@ -29,6 +42,13 @@ from flask_admin.menu import SubMenuCategory  # noqa: F401
 from flask_admin.theme import Bootstrap4Theme
 from flask_admin.theme import Theme
 
+log = logging.getLogger("flask-admin")
+
+try:
+    from flask import stream_template
+except ImportError:  # Flask < 2.2
+    stream_template = None  # type: ignore[assignment]
+
 
 def expose(
     url: str = "/", methods: t.Iterable[str] | None = ("GET",)
@@ -343,6 +363,41 @@ class BaseView(BaseViewClass, metaclass=AdminViewMeta):
 
         :param template:
             Template path to render
+        :param kwargs:
+            Template arguments
+        """
+        return render_template(template, **self._get_render_args(kwargs))
+
+    def stream(self, template: str, **kwargs: t.Any) -> Response:
+        """
+        Render template as a streamed response. Parts of the page are sent
+        to the client as soon as they are rendered.
+
+        The response headers are sent before rendering starts, so the session
+        can not be modified from within the template.
+
+        :param template:
+            Template path to render
+        :param kwargs:
+            Template arguments
+        """
+        kwargs = self._get_render_args(kwargs)
+
+        # Consume pending flash messages while the session can still be saved
+        get_flashed_messages()
+
+        if stream_template is not None:
+            return Response(stream_template(template, **kwargs))
+
+        app = current_app._get_current_object()
+        app.update_template_context(kwargs)
+        jinja_template = app.jinja_env.get_or_select_template(template)
+        return Response(stream_with_context(jinja_template.generate(kwargs)))
+
+    def _get_render_args(self, kwargs: dict[str, t.Any]) -> dict[str, t.Any]:
+        """
+        Add the default admin arguments to the template arguments.
+
         :param kwargs:
             Template arguments
         """
@@ -371,7 +426,7 @@ class BaseView(BaseViewClass, metaclass=AdminViewMeta):
         # Contribute extra arguments
         kwargs.update(self._template_args)
 
-        return render_template(template, **kwargs)
+        return kwargs
 
     def _prettify_class_name(self, name: str) -> str:
         """
@@ -538,6 +593,12 @@ class Admin:
     Collection of the admin views. Also manages menu structure.
     """
 
+    menu_cache_size: int = 256
+    """
+        Maximum number of menus cached by `menu_cache_key`. The least recently
+        used menu is dropped when the cache is full.
+    """
+
     def __init__(
         self,
         app: Flask | None = None,
@@ -552,6 +613,8 @@ class Admin:
         category_icon_classes: dict[str, str] | None = None,
         host: str | None = None,
         csp_nonce_generator: t.Callable[[], t.Any] | None = None,
+        menu_cache_key: t.Callable[[], t.Hashable] | None = None,
+        template_bytecode_cache: str | os.PathLike[str] | BytecodeCache | None = None,
     ) -> None:
         """
         Constructor.
@@ -586,6 +649,22 @@ class Admin:
             The host to register all admin views on. Mutually exclusive with `subdomain`
         :param csp_nonce_generator:
             A callable that returns a nonce to inject into Flask-Admin JS, CSS, etc.
+        :param menu_cache_key:
+            A callable that returns a fingerprint of the permissions of the
+            current user, like a tuple of role names. If set, the rendered menu
+            is cached by this fingerprint and reused for every user with the
+            same fingerprint, so the menu does not check `is_accessible` and
+            `is_visible` of every view on every page. Menus are cached per
+            script root, and per request host if `host` or `subdomain` is set.
+            The fingerprint must cover anything else the menu depends on, like
+            the current locale.
+            Call `clear_menu_cache` when permissions change.
+        :param template_bytecode_cache:
+            Directory or :class:`jinja2.BytecodeCache` used by the Jinja
+            environment of the application to store compiled templates, so
+            worker processes do not compile the admin templates again. Fill
+            it at build time with ``flask admin compile-templates``. Ignored
+            if the environment already has a bytecode cache.
         """
         self.app = app
 
@@ -595,6 +674,9 @@ class Admin:
         self._menu: list[MenuView | MenuCategory | BaseMenu] = []
         self._menu_categories: dict[str, MenuCategory] = dict()
         self._menu_links: list[MenuLink] = []
+        self._menu_cache: OrderedDict[t.Hashable, Markup] = OrderedDict()
+        self._frozen = False
+        self._startup_report_logged = False
 
         if name is None:
             name = "Admin"
@@ -612,6 +694,8 @@ class Admin:
         self._validate_admin_host_and_subdomain()
 
         self.csp_nonce_generator = csp_nonce_generator
+        self.menu_cache_key = menu_cache_key
+        self.template_bytecode_cache = template_bytecode_cache
 
         # Add index view
         self._set_admin_index_view(index_view=index_view, endpoint=endpoint, url=url)
@@ -649,6 +733,9 @@ class Admin:
         :param view:
             View to add.
         """
+        self._check_not_frozen()
+        self.clear_menu_cache()
+
         # Add to views
         self._views.append(view)
 
@@ -731,6 +818,9 @@ class Admin:
         :param icon_value:
             The icon value for the new menu category.
         """
+        self._check_not_frozen()
+        self.clear_menu_cache()
+
         cat_text = as_unicode(name)
 
         category = self.get_category_menu_item(name)
@@ -754,6 +844,9 @@ class Admin:
             The name of a parent_name category
         """
 
+        self._check_not_frozen()
+        self.clear_menu_cache()
+
         name_text = as_unicode(name)
         parent_name_text = as_unicode(parent_name)
         category = self.get_category_menu_item(name_text)
@@ -770,6 +863,9 @@ class Admin:
         :param link:
             Link to add.
         """
+        self._check_not_frozen()
+        self.clear_menu_cache()
+
         if link.category:
             self.add_menu_item(link, link.category)
         else:
@@ -802,6 +898,9 @@ class Admin:
         :param target_category:
             Target category name
         """
+        self._check_not_frozen()
+        self.clear_menu_cache()
+
         if target_category:
             cat_text = as_unicode(target_category)
 
@@ -874,6 +973,27 @@ class Admin:
         for view in self._views:
             app.register_blueprint(view.create_blueprint(self), host=self.host)
 
+    def _log_startup_report(self) -> None:
+        """
+        Log the startup report once, on the first request of the application.
+
+        Views are usually added after the admin was bound to the application,
+        so the report is not complete before.
+        """
+        if self._startup_report_logged:
+            return
+
+        self._startup_report_logged = True
+
+        report = self.get_startup_report()
+        if report:
+            log.info(
+                "Scaffolded %d admin views in %.3fs",
+                len(report),
+                sum(entry["time"] for entry in report),
+                extra={"admin_endpoint": self.endpoint, "startup_report": report},
+            )
+
     def _init_extension(self) -> None:
         if not hasattr(self.app, "extensions"):
             self.app.extensions = dict()  # type: ignore[attr-defined]
@@ -895,6 +1015,199 @@ class Admin:
         admins.append(self)
         self.app.extensions["admin"] = admins  # type: ignore[union-attr]
 
+        self._init_bytecode_cache(self.app)  # type: ignore[arg-type]
+
+        self.app.before_request(self._log_startup_report)  # type: ignore[union-attr]
+
+        if "admin" not in self.app.cli.commands:  # type: ignore[union-attr]
+            from flask_admin.cli import admin_cli
+
+            self.app.cli.add_command(admin_cli)  # type: ignore[union-attr]
+
+    def _init_bytecode_cache(self, app: Flask) -> None:
+        cache = self.template_bytecode_cache
+        if cache is None:
+            return
+
+        if not isinstance(cache, BytecodeCache):
+            os.makedirs(cache, exist_ok=True)
+            cache = FileSystemBytecodeCache(os.fspath(cache))
+
+        # Do not create the environment early, `jinja_options` would be ignored
+        if "jinja_env" in vars(app):
+            if app.jinja_env.bytecode_cache is None:
+                app.jinja_env.bytecode_cache = cache
+        elif app.jinja_options.get("bytecode_cache") is None:
+            app.jinja_options = {**app.jinja_options, "bytecode_cache": cache}
+
+    def get_startup_report(self) -> list[dict[str, t.Any]]:
+        """
+        Return the time spent scaffolding each model view, slowest first.
+
+        Every entry has the `endpoint` and `name` of the view, the total
+        `time` in seconds, the traced `memory` in bytes (``None`` unless
+        :mod:`tracemalloc` was tracing) and the timings of the individual
+        scaffolding `steps`. Views that did not scaffold yet, because of
+        `lazy_scaffolding`, are left out.
+        """
+        report = []
+        for view in self._views:
+            profile = getattr(view, "scaffold_profile", None)
+            if not profile or "_refresh_cache" not in profile:
+                continue
+
+            total = profile["_refresh_cache"]
+            report.append(
+                {
+                    "endpoint": view.endpoint,
+                    "name": as_unicode(view.name),
+                    "time": total["time"],
+                    "memory": total["memory"],
+                    "steps": {
+                        step: dict(value)
+                        for step, value in profile.items()
+                        if step != "_refresh_cache"
+                    },
+                }
+            )
+
+        report.sort(key=lambda entry: entry["time"], reverse=True)
+        return report
+
+    def warm_up(self, background: bool = False) -> threading.Thread | None:
+        """
+        Scaffold all views that deferred it with `lazy_scaffolding`.
+
+        :param background:
+            Scaffold the views in a daemon thread and return the thread, so
+            the application can serve requests in the meantime.
+        """
+        views = [view for view in self._views if hasattr(view, "ensure_scaffolded")]
+        app = self.app
+
+        def warm_up() -> None:
+            with app.app_context() if app is not None else nullcontext():
+                for view in views:
+                    view.ensure_scaffolded()
+
+        if not background:
+            warm_up()
+            return None
+
+        thread = threading.Thread(target=warm_up, name="flask-admin-warm-up")
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def freeze(self, gc_freeze: bool = True) -> None:
+        """
+        Complete the setup of all views before a preforking server starts its
+        workers, so the workers share a single copy of it.
+
+        Scaffolds the views that use `lazy_scaffolding`, compiles the admin
+        templates and prevents further changes to the views and the menu.
+        Call it once all views were added::
+
+            admin.add_views(*views)
+            admin.freeze()
+
+        :param gc_freeze:
+            Move all objects tracked by the garbage collector to its permanent
+            generation with :func:`gc.freeze`, so collections in the workers
+            do not write to the memory pages shared with the parent process.
+        """
+        self.warm_up()
+
+        if self.app is not None:
+            with self.app.app_context():
+                self._compile_templates(self.app)
+
+        self._frozen = True
+
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+
+    def _compile_templates(self, app: Flask) -> list[str]:
+        env = app.jinja_env
+
+        names = {self.theme.base_template}
+        for view in self._views:
+            # Template settings of the view, like `list_template`
+            for scope in (*type(view).__mro__, view):
+                names.update(
+                    value
+                    for key, value in vars(scope).items()
+                    if key.endswith("_template") and isinstance(value, str)
+                )
+
+        try:
+            names.update(n for n in env.list_templates() if n.startswith("admin/"))
+        except TypeError:
+            # Loader can not list templates
+            pass
+
+        compiled = []
+        for name in sorted(names):
+            try:
+                env.get_template(name)
+            except TemplateNotFound:
+                continue
+            compiled.append(name)
+
+        return compiled
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen:
+            raise Exception("Cannot change views or menu of a frozen Admin instance.")
+
+    def render_menu(
+        self, name: str, view: BaseView, render: t.Callable[[], str]
+    ) -> Markup:
+        """
+        Render a menu, caching it by `menu_cache_key` if one was set.
+
+        :param name:
+            Name of the menu, like ``menu`` or ``menu_links``
+        :param view:
+            Current view, the menu highlights its item
+        :param render:
+            Callable that renders the menu, usually a macro of the layout
+            template
+        """
+        if self.menu_cache_key is None:
+            return Markup(render())
+
+        # Menu URLs depend on the mount point of the request, and on its host
+        # only if admin views are routed by host or subdomain
+        routed_by_host = self.host is not None or self.subdomain is not None
+        key = (
+            name,
+            view.endpoint,
+            request.host if routed_by_host else None,
+            request.script_root,
+            self.menu_cache_key(),
+        )
+
+        menu = self._menu_cache.pop(key, None)
+        if menu is None:
+            menu = Markup(render())
+
+        self._menu_cache[key] = menu
+        if len(self._menu_cache) > self.menu_cache_size:
+            self._menu_cache.popitem(last=False)
+
+        return menu
+
+    def clear_menu_cache(self) -> None:
+        """
+        Remove all menus cached by `menu_cache_key`.
+
+        Call it when the permissions behind the fingerprints change. Adding
+        views or menu items clears the cache too.
+        """
+        self._menu_cache.clear()
+
     def menu(self) -> list[MenuView | MenuCategory | BaseMenu]:
         """
         Return the menu hierarchy.
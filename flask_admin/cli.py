@@ -0,0 +1,82 @@
+import json
+import os
+import typing as t
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from jinja2 import FileSystemBytecodeCache
+
+admin_cli = AppGroup("admin", help="Flask-Admin commands.")
+
+
+@admin_cli.command("startup-report")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON.")
+@click.option(
+    "--limit",
+    type=int,
+    default=None,
+    help="Only show the given number of slowest views.",
+)
+def startup_report(as_json: bool, limit: int | None) -> None:
+    """Show the time spent scaffolding each admin view."""
+    report: list[dict[str, t.Any]] = []
+    for admin in current_app.extensions.get("admin", []):
+        # Views with lazy scaffolding are scaffolded on demand
+        admin.warm_up()
+        report.extend(admin.get_startup_report())
+
+    report.sort(key=lambda entry: entry["time"], reverse=True)
+    if limit is not None:
+        report = report[:limit]
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    if not report:
+        click.echo("No admin views were scaffolded.")
+        return
+
+    for entry in report:
+        line = f"{entry['endpoint']}: {entry['time'] * 1000:.1f} ms"
+        if entry["memory"] is not None:
+            line += f", {entry['memory'] / 1024:.1f} KiB"
+        click.echo(line)
+
+        for step, value in sorted(
+            entry["steps"].items(), key=lambda item: item[1]["time"], reverse=True
+        ):
+            click.echo(f"    {step}: {value['time'] * 1000:.1f} ms")
+
+
+@admin_cli.command("compile-templates")
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory to write the compiled templates to. Defaults to the "
+    "bytecode cache of the application.",
+)
+def compile_templates(cache_dir: str | None) -> None:
+    """Compile the admin templates into the Jinja bytecode cache."""
+    env = current_app.jinja_env
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    elif env.bytecode_cache is None:
+        raise click.UsageError(
+            "The application has no Jinja bytecode cache. Set "
+            "`template_bytecode_cache` of Admin or pass --cache-dir."
+        )
+
+    # Templates already loaded by this process would not be written
+    if env.cache is not None:
+        env.cache.clear()
+
+    names: set[str] = set()
+    for admin in current_app.extensions.get("admin", []):
+        names.update(admin._compile_templates(current_app))
+
+    click.echo(f"Compiled {len(names)} templates.")
@@ -18,6 +18,7 @@ except ImportError as e:
     ) from e
 
 import flask
+from werkzeug.http import is_resource_modified
 
 from . import BaseFileAdmin
 from . import BaseFileStorage
@@ -180,7 +181,21 @@ class AzureStorage(BaseFileStorage):
         path = self._ensure_blob_path(file_path)
         if path is None:
             raise ValueError("No path provided")
-        blob = self._container_client.get_blob_client(path).download_blob()
+        blob_client = self._container_client.get_blob_client(path)
+
+        # Answer conditional requests without downloading the blob
+        properties = blob_client.get_blob_properties()
+        etag = properties.etag.strip('"')
+        last_modified = properties.last_modified
+        if not is_resource_modified(
+            flask.request.environ, etag=etag, last_modified=last_modified
+        ):
+            response = flask.Response(status=304)
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            return response
+
+        blob = blob_client.download_blob()
         if not blob.properties or not blob.properties.has_key("content_settings"):
             raise ValueError("Blob has no properties")
         mime_type = blob.properties["content_settings"]["content_type"]
@@ -192,6 +207,8 @@ class AzureStorage(BaseFileStorage):
             mimetype=mime_type,
             as_attachment=True,
             download_name=path,
+            etag=etag,
+            last_modified=last_modified,
         )
 
     def read_file(self, path: str | None) -> bytes:
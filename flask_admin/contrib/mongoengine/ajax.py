@@ -8,6 +8,8 @@ from flask_admin.model.ajax import DEFAULT_PAGE_SIZE
 
 
 class QueryAjaxModelLoader(AjaxModelLoader):
+    supports_keyset = True
+
     def __init__(self, name, model, **options):
         """
         Constructor.
@@ -53,14 +55,22 @@ class QueryAjaxModelLoader(AjaxModelLoader):
     def get_one(self, pk):
         return self.model.objects.filter(pk=pk).first()
 
-    def get_list(self, query, offset=0, limit=DEFAULT_PAGE_SIZE):
-        query = self.model.objects
+    def get_many(self, pks):
+        pks = list(pks)
+
+        if not pks:
+            return []
+
+        return list(self.model.objects.filter(pk__in=pks))
+
+    def get_list(self, term, offset=0, limit=DEFAULT_PAGE_SIZE, after=None):
+        query = self.model.objects.order_by("pk")
 
-        if len(query) > 0:
+        if len(term) > 0:
             criteria = None
 
             for field in self._cached_fields:
-                flt = {f"{field.name}__icontains": query}
+                flt = {f"{field.name}__icontains": term}
 
                 if not criteria:
                     criteria = mongoengine.Q(**flt)
@@ -69,7 +79,9 @@ class QueryAjaxModelLoader(AjaxModelLoader):
 
             query = query.filter(criteria)
 
-        if offset:
+        if after is not None:
+            query = query.filter(pk__gt=after)
+        elif offset:
             query = query.skip(offset)
 
         return query.limit(limit).all()
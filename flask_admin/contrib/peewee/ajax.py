@@ -31,6 +31,7 @@ class QueryAjaxModelLoader(AjaxModelLoader):
         self._cached_fields = self._process_fields()
 
         self.pk = get_primary_key(model)
+        self.supports_keyset = True
 
     def _process_fields(self) -> list[t.Any]:
         remote_fields = []
@@ -57,10 +58,24 @@ class QueryAjaxModelLoader(AjaxModelLoader):
     def get_one(self, pk: t.Any) -> t.Any:
         return self.model.get(**{self.pk: pk})
 
+    def get_many(self, pks: t.Iterable[t.Any]) -> list[t.Any]:
+        pks = list(pks)
+
+        if not pks:
+            return []
+
+        query = self.model.select().where(getattr(self.model, self.pk).in_(pks))
+        return list(query.execute())
+
     def get_list(
-        self, term: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
+        self,
+        term: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: t.Any = None,
     ) -> list[t.Any]:
-        query = self.model.select()
+        pk_field = getattr(self.model, self.pk)
+        query = self.model.select().order_by(pk_field)
 
         if len(term) > 0:
             stmt = None
@@ -74,7 +89,9 @@ class QueryAjaxModelLoader(AjaxModelLoader):
 
             query = query.where(stmt)
 
-        if offset:
+        if after is not None:
+            query = query.where(pk_field > after)
+        elif offset:
             query = query.offset(offset)
 
         return list(query.limit(limit).execute())
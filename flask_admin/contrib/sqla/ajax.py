@@ -36,6 +36,9 @@ class QueryAjaxModelLoader(AjaxModelLoader):
             Fields to run query against
         :param filters:
             Additional filters to apply to the loader
+        :param order_by:
+            Ordering of the results. When not set, results are ordered by
+            primary key and paginated using keyset continuation.
         """
         super().__init__(name, options)
 
@@ -59,6 +62,11 @@ class QueryAjaxModelLoader(AjaxModelLoader):
             )
 
         self.pk: str = t.cast(str, get_primary_key(model))
+        self.supports_keyset = self.order_by is None
+
+        # Build query clauses once instead of on every lookup
+        self._cached_search_columns = self._process_search_columns()
+        self._cached_filters = self._process_filters()
 
     def _process_fields(self) -> list[t.Any]:
         remote_fields = []
@@ -77,6 +85,24 @@ class QueryAjaxModelLoader(AjaxModelLoader):
 
         return remote_fields
 
+    def _process_search_columns(self) -> list[t.Any]:
+        # no type casting to string if a ColumnAssociationProxyInstance is given
+        return [
+            field if is_association_proxy(field) else cast(field, String)
+            for field in self._cached_fields
+        ]
+
+    def _process_filters(self) -> t.Any:
+        if not self.filters:
+            return None
+
+        return and_(
+            *[
+                text(f"{self.model.__tablename__.lower()}.{value}")
+                for value in self.filters
+            ]
+        )
+
     def format(self, model: T_SQLALCHEMY_MODEL | None) -> tuple[t.Any, str] | None:
         if not model:
             return None
@@ -93,29 +119,45 @@ class QueryAjaxModelLoader(AjaxModelLoader):
         with session.no_autoflush:
             return session.get(self.model, pk)
 
+    def get_many(self, pks: t.Iterable[t.Any]) -> list[t.Any]:
+        pks = list(pks)
+
+        if not pks:
+            return []
+
+        session = _get_deprecated_session(self.session)
+        # prevent autoflush from occuring during populate_obj
+        with session.no_autoflush:
+            return (
+                session.query(self.model)
+                .filter(getattr(self.model, self.pk).in_(pks))
+                .all()
+            )
+
     def get_list(
-        self, term: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
+        self,
+        term: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: t.Any = None,
     ) -> t.Any:
         query = self.get_query()
 
-        # no type casting to string if a ColumnAssociationProxyInstance is given
-        filters: t.Any = (
-            field.ilike(f"%{term}%")
-            if is_association_proxy(field)
-            else cast(field, String).ilike(f"%{term}%")
-            for field in self._cached_fields
+        query = query.filter(
+            or_(*[column.ilike(f"%{term}%") for column in self._cached_search_columns])
         )
-        query = query.filter(or_(*filters))
 
-        if self.filters:
-            filters = [
-                text(f"{self.model.__tablename__.lower()}.{value}")
-                for value in self.filters
-            ]
-            query = query.filter(and_(*filters))
+        if self._cached_filters is not None:
+            query = query.filter(self._cached_filters)
 
         if self.order_by:
             query = query.order_by(self.order_by)
+        else:
+            pk_column = getattr(self.model, self.pk)
+            query = query.order_by(pk_column)
+
+            if after is not None:
+                return query.filter(pk_column > after).limit(limit).all()
 
         return query.offset(offset).limit(limit).all()
 
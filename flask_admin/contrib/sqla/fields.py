@@ -5,6 +5,11 @@ Useful form fields for use with SQLAlchemy ORM.
 import operator
 import typing as t
 
+from flask import has_request_context
+from flask import request
+from flask import url_for
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.util import identity_key
 from wtforms import form
 from wtforms.fields import SelectFieldBase
@@ -33,6 +38,8 @@ from ...model.form import InlineBaseFormAdmin
 from ._compat import _get_deprecated_session
 from ._types import T_SESSION_OR_DB
 from .tools import get_primary_key
+from .tools import tuple_operator_in
+from .validators import prefetch_unique
 
 
 class QuerySelectField(SelectFieldBase):
@@ -332,6 +339,11 @@ class InlineModelFormList(InlineFieldList):
 
         self._pk = get_primary_key(model)
 
+        # Pagination state, only used when `inline_view.page_size` is set
+        self.page_size: int | None = getattr(inline_view, "page_size", None)
+        self.page = 0
+        self.page_count = 1
+
         # Generate inline form field
         form_opts = FormOpts(
             widget_args=getattr(inline_view, "form_widget_args", None),
@@ -349,34 +361,175 @@ class InlineModelFormList(InlineFieldList):
     def display_row_controls(self, field: InlineModelFormField) -> bool:
         return field.get_pk() is not None
 
+    def validate(
+        self,
+        form: form.BaseForm,
+        extra_validators: tuple[t.Any] = tuple(),  # type: ignore[assignment]
+    ) -> bool:
+        # Check unique columns of all subforms with one query per column
+        prefetch_unique(
+            entry.form for entry in self.entries if not self.should_delete(entry)
+        )
+
+        return super().validate(form, extra_validators)
+
+    def process(
+        self,
+        formdata: dict[str, str] | None,
+        data: UnsetValue | list[t.Any] = unset_value,
+        extra_filters: t.Any = None,
+    ) -> None:
+        if self.page_size and data is not unset_value and data is not None:
+            data = self._get_page_data(data)
+
+        return super().process(formdata, data, extra_filters)
+
+    @property
+    def page_arg(self) -> str:
+        """
+        Name of the URL argument holding the displayed page number.
+        """
+        return f"{self.name}-page"
+
+    def get_page_url(self, page: int) -> str:
+        """
+        Return URL of the current view displaying the given page of the list.
+
+        :param page:
+            Page number, starting from 0
+        """
+        args = dict(request.view_args or {})
+        args.update(request.args.to_dict())
+        args[self.page_arg] = page
+
+        return url_for(request.endpoint, **args)  # type: ignore[arg-type]
+
+    def _get_page_data(self, data: t.Any) -> list[t.Any]:
+        page_size = t.cast(int, self.page_size)
+
+        if has_request_context():
+            self.page = max(request.args.get(self.page_arg, 0, type=int), 0)
+
+        # Dynamic relationships are queries and can be paginated by the database,
+        # ordered by primary key so pages neither overlap nor skip rows
+        if hasattr(data, "offset"):
+            count = data.count()
+            self.page_count = max((count + page_size - 1) // page_size, 1)
+            self.page = min(self.page, self.page_count - 1)
+
+            data = data.order_by(*sa_inspect(self.model).primary_key)
+            page_data = data.offset(self.page * page_size).limit(page_size).all()
+        else:
+            # Other collections are loaded in full by the relationship
+            data = list(data)
+            self.page_count = max((len(data) + page_size - 1) // page_size, 1)
+            self.page = min(self.page, self.page_count - 1)
+
+            start = self.page * page_size
+            page_data = data[start : start + page_size]
+
+        self._load_relations(page_data)
+
+        return page_data
+
+    def _load_relations(self, models: list[t.Any]) -> None:
+        """
+        Load relations displayed by the inline forms of the given models with
+        a single `selectinload` query instead of one lazy load per model.
+        """
+        relations = [
+            getattr(self.model, prop.key)
+            for prop in sa_inspect(self.model).relationships
+            if prop.key != self.prop
+            and prop.lazy == "select"
+            and hasattr(self.form, prop.key)
+        ]
+
+        if not models or not relations:
+            return
+
+        if isinstance(self._pk, tuple):
+            keys = [tuple(getattr(m, pk) for pk in self._pk) for m in models]
+        else:
+            keys = [getattr(m, self._pk) for m in models]
+
+        session = _get_deprecated_session(self.session)
+        with session.no_autoflush:
+            session.query(self.model).filter(self._get_pk_clause(keys)).options(
+                *[selectinload(relation) for relation in relations]
+            ).all()
+
+    def _get_pk_clause(self, keys: list[t.Any]) -> t.Any:
+        """
+        Return a clause matching the models with the given primary keys.
+        """
+        if isinstance(self._pk, tuple):
+            return tuple_operator_in(
+                [getattr(self.model, pk) for pk in self._pk], tuple(keys)
+            )
+
+        return getattr(self.model, self._pk).in_(keys)
+
+    def _get_submitted_models(self, values: t.Any) -> list[t.Any]:
+        """
+        Load the models of a dynamic relationship whose primary keys were
+        submitted, with a single query.
+        """
+        keys = []
+        for field in self.entries:
+            field_id = field.get_pk()
+            if isinstance(field_id, tuple):
+                if all(v not in (None, "") for v in field_id):
+                    keys.append(field_id)
+            elif field_id not in (None, ""):
+                keys.append(field_id)
+
+        if not keys:
+            return []
+
+        return values.filter(self._get_pk_clause(keys)).all()
+
     def populate_obj(self, obj: t.Any, name: str) -> None:
         values = getattr(obj, name, None)
 
         if values is None:
             return
 
-        # Create primary key map
-        pk_map = dict((get_obj_pk(v, self._pk), v) for v in values)
+        session = _get_deprecated_session(self.session)
+
+        # Only the submitted models are touched, the unit of work then emits
+        # UPDATE statements for changed rows and batches inserts and deletes.
+        # Autoflush is disabled so that looking up related models does not
+        # flush every child separately.
+        with session.no_autoflush:
+            # Paginated dynamic relationships load only the submitted models,
+            # other relationships are loaded in full to map primary keys
+            if self.page_size and hasattr(values, "filter"):
+                models = self._get_submitted_models(values)
+            else:
+                models = values
+
+            # Create primary key map
+            pk_map = dict((get_obj_pk(v, self._pk), v) for v in models)
 
-        # Handle request data
-        for field in self.entries:
-            field_id = get_field_id(field)
+            # Handle request data
+            for field in self.entries:
+                field_id = get_field_id(field)
 
-            is_created = field_id not in pk_map
-            if not is_created:
-                model = pk_map[field_id]
+                is_created = field_id not in pk_map
+                if not is_created:
+                    model = pk_map[field_id]
 
-                if self.should_delete(field):
-                    session = _get_deprecated_session(self.session)
-                    session.delete(model)
-                    continue
-            else:
-                model = self.model()
-                values.append(model)
+                    if self.should_delete(field):
+                        session.delete(model)
+                        continue
+                else:
+                    model = self.model()
+                    values.append(model)
 
-            field.populate_obj(model, None)
+                field.populate_obj(model, None)
 
-            self.inline_view._on_model_change(field, model, is_created)
+                self.inline_view._on_model_change(field, model, is_created)
 
 
 class InlineModelOneToOneField(InlineModelFormField):
@@ -1,9 +1,12 @@
+import sys
+
 from sqlalchemy.ext.associationproxy import _AssociationList
 from sqlalchemy.orm.collections import InstrumentedList
 
 from flask_admin._types import T_ARROW
 from flask_admin._types import T_CHOICE
 from flask_admin._types import T_MODEL_VIEW
+from flask_admin._types import T_TYPE_FORMATTER
 from flask_admin.model.typefmt import BASE_FORMATTERS
 from flask_admin.model.typefmt import EXPORT_FORMATTERS
 from flask_admin.model.typefmt import list_formatter
@@ -51,17 +54,36 @@ DEFAULT_FORMATTERS.update(
         _AssociationList: list_formatter,
     }
 )
-try:
-    from sqlalchemy_utils import Choice
+# Formatters for types of optional libraries. The libraries are slow to import
+# and values of their types only exist once the application imported them, so
+# the formatters are added by `register_optional_formatters` instead: when this
+# module is imported and again when SQLAlchemy views are initialized.
+OPTIONAL_FORMATTERS: list[
+    tuple[str, str, T_TYPE_FORMATTER, T_TYPE_FORMATTER | None]
+] = [
+    ("sqlalchemy_utils", "Choice", choice_formatter, None),
+    ("arrow", "Arrow", arrow_formatter, arrow_export_formatter),
+]
+
+
+def register_optional_formatters() -> None:
+    """
+    Add formatters for types of the optional libraries that were imported to
+    `DEFAULT_FORMATTERS` and `EXPORT_FORMATTERS`.
+
+    Formatters already set for these types are kept. Formatters of views
+    are not changed, views that set their own `column_type_formatters`
+    have to add these types themselves.
+    """
+    for module_name, type_name, formatter, export_formatter in OPTIONAL_FORMATTERS:
+        module = sys.modules.get(module_name)
+        typeobj = getattr(module, type_name, None)
+        if typeobj is None:
+            continue
 
-    DEFAULT_FORMATTERS[Choice] = choice_formatter
-except ImportError:
-    pass
+        DEFAULT_FORMATTERS.setdefault(typeobj, formatter)
+        if export_formatter is not None:
+            EXPORT_FORMATTERS.setdefault(typeobj, export_formatter)
 
-try:
-    from arrow import Arrow
 
-    DEFAULT_FORMATTERS[Arrow] = arrow_formatter
-    EXPORT_FORMATTERS[Arrow] = arrow_export_formatter
-except ImportError:
-    pass
+register_optional_formatters()
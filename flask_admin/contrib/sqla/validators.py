@@ -61,11 +61,49 @@ class Unique:
         pk_attrs = [col.key for col in mapper.primary_key]
         return all(getattr(obj_a, attr) == getattr(obj_b, attr) for attr in pk_attrs)
 
+    def get_matches(self, values: t.Iterable[t.Any]) -> dict[t.Any, list[t.Any]] | None:
+        """Find existing records for all `values` with a single query.
+
+        Return a dictionary mapping every value to the list of records having
+        it, or None if the values returned by the database do not compare
+        equal to the submitted ones (e.g. with a case-insensitive collation).
+
+        :param values:
+            Values to look up
+        """
+        result: dict[t.Any, list[t.Any]] = {value: [] for value in values}
+
+        if not result:
+            return result
+
+        column: t.Any = self.column
+        rows = (
+            self.db_session.query(self.model, column)
+            .filter(column.in_(list(result)))
+            .all()
+        )
+
+        for obj, value in rows:
+            if value not in result:
+                return None
+
+            result[value].append(obj)
+
+        return result
+
     def __call__(self, form: Form, field: Field) -> None:
         # databases allow multiple NULL values for unique columns
         if field.data is None:
             return
 
+        # Records found by `prefetch_unique`
+        prefetched = getattr(field, "_unique_matches", {})
+        if self in prefetched:
+            for obj in prefetched[self]:
+                if not hasattr(form, "_obj") or not self._same_record(form._obj, obj):
+                    raise ValidationError(str(self.message))
+            return
+
         try:
             obj = (
                 self.db_session.query(self.model)
@@ -79,6 +117,50 @@ class Unique:
             pass
 
 
+def prefetch_unique(forms: t.Iterable[BaseForm]) -> None:
+    """
+    Look up the values checked by the :class:`Unique` validators of `forms`
+    with a single query per validator instead of one query per field.
+
+    Used to validate inline lists, where every subform shares the same
+    validators. Matching records are stored on the fields and reported as
+    regular field errors when the forms are validated.
+
+    :param forms:
+        Forms to prefetch the lookups for
+    """
+    fields: dict[Unique, list[Field]] = {}
+
+    for form in forms:
+        for field in form:
+            if field.data is None:
+                continue
+
+            for validator in field.validators:
+                if isinstance(validator, Unique):
+                    fields.setdefault(validator, []).append(field)
+
+    for validator, validator_fields in fields.items():
+        # A single field is checked by the validator itself
+        if len(validator_fields) < 2:
+            continue
+
+        try:
+            matches = validator.get_matches(f.data for f in validator_fields)
+        except TypeError:
+            # Unhashable values
+            continue
+
+        if matches is None:
+            continue
+
+        for field in validator_fields:
+            if not hasattr(field, "_unique_matches"):
+                field._unique_matches = {}
+
+            field._unique_matches[validator] = matches[field.data]
+
+
 class ItemsRequired(InputRequired):
     """
     A version of the ``InputRequired`` validator that works with relations,
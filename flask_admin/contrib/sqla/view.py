@@ -14,6 +14,7 @@ from sqlalchemy import Unicode
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.base import instance_state
 from sqlalchemy.orm.base import manager_of_class
@@ -21,6 +22,7 @@ from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.expression import cast as sql_cast
 from sqlalchemy.sql.expression import desc
 from wtforms import Form
+from wtforms.fields.core import UnboundField
 
 from flask_admin._backwards import ObsoleteAttr
 from flask_admin._compat import string_types
@@ -51,8 +53,10 @@ from ._types import T_SESSION_OR_DB
 from ._types import T_SQLALCHEMY_QUERY
 from .ajax import create_ajax_loader
 from .ajax import QueryAjaxModelLoader
+from .fields import InlineModelFormList
 from .filters import BaseSQLAFilter
 from .typefmt import DEFAULT_FORMATTERS
+from .typefmt import register_optional_formatters
 
 # Set up logger
 log = logging.getLogger("flask-admin.sqla")
@@ -102,6 +106,37 @@ class ModelView(BaseModelView):
         Please refer to the `subqueryload` on list of possible values.
     """
 
+    get_one_auto_select_related: bool = True
+    """
+        Enable automatic detection of relations displayed in the details and
+        edit views and eager load them when these views fetch their record
+        with `get_one_for_display`.
+
+        Each view has its own plan: the details view loads the relations of
+        the details columns, the edit view the relation fields and inline
+        models of the edit form. Many-to-one relations are loaded with
+        `joinedload`, collections with `selectinload`. Inline models with a
+        `page_size` are not eager loaded, they load only the displayed page.
+    """
+
+    get_one_select_related_list: t.Sequence[str | T_INSTRUMENTED_ATTRIBUTE] | None = (
+        None
+    )
+    """
+        List of relations eager loaded by `get_one_for_display`. Overrides
+        `get_one_auto_select_related` property.
+
+        For example::
+
+            class PostAdmin(ModelView):
+                get_one_select_related_list = ('user', 'tags')
+
+        You can also use properties::
+
+            class PostAdmin(ModelView):
+                get_one_select_related_list = (Post.user, Post.tags)
+    """
+
     column_display_all_relations: bool | None = t_cast(
         bool,
         ObsoleteAttr(
@@ -339,6 +374,17 @@ class ModelView(BaseModelView):
                ignore_hidden = False
     """
 
+    scaffold_cache_attributes = BaseModelView.scaffold_cache_attributes + (
+        "session",
+        "column_display_all_relations",
+        "model_form_converter",
+        "inline_model_form_converter",
+        "inline_models",
+        "form_choices",
+        "form_optional_types",
+        "ignore_hidden",
+    )
+
     def __init__(
         self,
         model: type[T_SQLALCHEMY_MODEL],
@@ -416,13 +462,25 @@ class ModelView(BaseModelView):
         if self._primary_key is None:
             raise Exception(f"Model {self.model.__name__} does not have primary key.")
 
+    def _refresh_cache(self) -> None:
+        # Formatters for types of optional libraries, like sqlalchemy_utils
+        register_optional_formatters()
+
+        super()._refresh_cache()
+
         # Configuration
         self._auto_joins: t.Iterable[t.Any]
         if not self.column_select_related_list:
-            self._auto_joins = self.scaffold_auto_joins()
+            with self._scaffold_step("scaffold_auto_joins"):
+                self._auto_joins = self.scaffold_auto_joins()
         else:
             self._auto_joins = self.column_select_related_list
 
+        # Eager loading plans for single records, one per view
+        self._get_one_options = {
+            view: self.scaffold_get_one_options(view) for view in ("details", "edit")
+        }
+
     # Internal API
     def _get_model_iterator(
         self, model: type[T_SQLALCHEMY_MODEL] | None = None
@@ -974,6 +1032,93 @@ class ModelView(BaseModelView):
 
         return joined
 
+    def scaffold_get_one_options(self, view: str) -> list[t.Any]:
+        """
+        Return a list of SQLAlchemy loader options applied by
+        `get_one_for_display`.
+
+        Override this method to customize how relations of a single record
+        are loaded.
+
+        :param view:
+            Name of the view the record is loaded for, "details" or "edit"
+        """
+        if self.get_one_select_related_list is not None:
+            relations = [
+                getattr(self.model, r) if isinstance(r, string_types) else r
+                for r in self.get_one_select_related_list
+            ]
+        elif self.get_one_auto_select_related:
+            relations = [
+                getattr(self.model, name) for name in self._get_get_one_relations(view)
+            ]
+        else:
+            relations = []
+
+        return [
+            selectinload(r) if r.property.uselist else joinedload(r) for r in relations
+        ]
+
+    def _get_get_one_relations(self, view: str) -> list[str]:
+        """
+        Return names of the relations displayed in the details or edit view.
+
+        :param view:
+            "details" for the details columns, "edit" for the edit form
+            fields and inline models
+        """
+        names: list[str] = []
+
+        if view == "details" and self.can_view_details:
+            for name, _label in self._details_columns:
+                if isinstance(name, string_types):
+                    names.append(name.split(".", 1)[0])
+
+        # Paginated inline lists load only the children of the displayed page
+        paginated: set[str] = set()
+
+        if view == "edit" and self.can_edit and self._edit_form_class is not None:
+            for name in dir(self._edit_form_class):
+                field = getattr(self._edit_form_class, name)
+                if not isinstance(field, UnboundField):
+                    continue
+
+                names.append(name)
+
+                if issubclass(field.field_class, InlineModelFormList):
+                    inline_view = (
+                        field.args[4]
+                        if len(field.args) > 4
+                        else field.kwargs.get("inline_view")
+                    )
+                    if getattr(inline_view, "page_size", None):
+                        paginated.add(name)
+
+        source_bind = getattr(self.model, "__bind_key__", None)
+        relations: list[str] = []
+
+        for name in names:
+            if name in relations or name in paginated:
+                continue
+
+            attr = getattr(self.model, name, None)
+            if attr is None or not is_relationship(attr):
+                continue
+
+            prop = attr.property
+
+            # Only relations loaded on access can be eager loaded
+            if prop.lazy not in ("select", True):
+                continue
+
+            # Check if it is pointing to a different bind
+            if getattr(prop.mapper.class_, "__bind_key__", None) != source_bind:
+                continue
+
+            relations.append(name)
+
+        return relations
+
     # AJAX foreignkey support
     def _create_ajax_loader(
         self, name: str, options: dict[str, t.Any]
@@ -1284,18 +1429,23 @@ class ModelView(BaseModelView):
 
         # Apply search criteria
         if self._search_supported and search:
-            query, count_query, joins, count_joins = self._apply_search(
-                query, count_query, joins, count_joins, search
-            )
+            with self._timing("search"):
+                query, count_query, joins, count_joins = self._apply_search(
+                    query, count_query, joins, count_joins, search
+                )
 
         # Apply filters
         if filters and self._filters:
-            query, count_query, joins, count_joins = self._apply_filters(
-                query, count_query, joins, count_joins, filters
-            )
+            with self._timing("filters"):
+                query, count_query, joins, count_joins = self._apply_filters(
+                    query, count_query, joins, count_joins, filters
+                )
 
         # Calculate number of rows if necessary
-        count = count_query.scalar() if count_query else None
+        count: int | None = None
+        if count_query:
+            with self._timing("count"):
+                count = count_query.scalar()
 
         # Auto join
         for j in self._auto_joins:
@@ -1309,7 +1459,8 @@ class ModelView(BaseModelView):
 
         # Execute if needed
         if execute:
-            query = query.all()  # type: ignore[assignment]
+            with self._timing("query"):
+                query = query.all()  # type: ignore[assignment]
 
         return count, query  # type: ignore[return-value]
 
@@ -1331,6 +1482,96 @@ class ModelView(BaseModelView):
         session = _get_deprecated_session(self.session)
         return session.get(self.model, tools.iterdecode(id))
 
+    def get_one_for_display(self, id: t.Any, view: str) -> t.Any:
+        """
+        Return a single model by its id for the edit or details view, with
+        the relations this view displays eager loaded.
+
+        See `get_one_auto_select_related` and `get_one_select_related_list`.
+
+        :param id:
+            Model id
+        :param view:
+            Name of the view, "details" or "edit"
+        """
+        # Custom `get_one` implementations are used as they are
+        if type(self).get_one is not ModelView.get_one:
+            return self.get_one(id)
+
+        session = _get_deprecated_session(self.session)
+        return session.get(
+            self.model, tools.iterdecode(id), options=self._get_one_options[view]
+        )
+
+    def get_many(self, ids: t.Sequence[t.Any]) -> list[T_SQLALCHEMY_MODEL]:
+        """
+        Return models by their ids with a single query.
+
+        :param ids:
+            List of model ids
+        """
+        if not ids:
+            return []
+
+        session = _get_deprecated_session(self.session)
+        query = tools.get_query_for_ids(
+            session.query(self.model), self.model, tuple(ids)
+        )
+        return query.all()
+
+    def get_one_version(self, id: t.Any) -> t.Any:
+        """
+        Return the value of `column_version` for a single record.
+
+        :param id:
+            Model id
+        """
+        if not self.column_version:
+            return None
+
+        names = self._primary_key
+        if not isinstance(names, tuple):
+            names = (names,)
+
+        model_pk = [getattr(self.model, name) for name in names]
+
+        session = _get_deprecated_session(self.session)
+        return (
+            session.query(getattr(self.model, self.column_version))
+            .filter(tools.tuple_operator_in(model_pk, (tools.iterdecode(id),)))
+            .scalar()
+        )
+
+    def get_list_version(
+        self, search: str | None, filters: t.Sequence[T_FILTER] | None
+    ) -> t.Any:
+        """
+        Return the number of records matching the list view query and the
+        maximum value of `column_version`.
+
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        """
+        if not self.column_version:
+            return None
+
+        joins: dict[tuple[bool, t.Any], t.Any] = {}
+        query = self.get_query()
+
+        if self._search_supported and search:
+            query, _, joins, _ = self._apply_search(query, None, joins, {}, search)
+
+        if filters and self._filters:
+            query, _, joins, _ = self._apply_filters(query, None, joins, {}, filters)
+
+        column = getattr(self.model, self.column_version)
+        count, version = (
+            query.order_by(None).with_entities(func.count(), func.max(column)).one()
+        )
+        return count, version
+
     # Error handler
     def handle_view_exception(self, exc: Exception) -> bool:
         if isinstance(exc, IntegrityError):
@@ -1424,6 +1665,38 @@ class ModelView(BaseModelView):
 
         return True
 
+    def update_models(
+        self, changes: t.Sequence[tuple[Form, T_SQLALCHEMY_MODEL]]
+    ) -> bool:
+        """
+        Update several models from forms in a single transaction.
+
+        :param changes:
+            List of tuples with form and model instance
+        """
+        session = _get_deprecated_session(self.session)
+        try:
+            for form, model in changes:
+                form.populate_obj(model)
+                self._on_model_change(form, model, False)
+            session.commit()
+        except Exception as ex:
+            if not self.handle_view_exception(ex):
+                flash(
+                    gettext("Failed to update record. %(error)s", error=str(ex)),
+                    "error",
+                )
+                log.exception("Failed to update record.")
+
+            session.rollback()
+
+            return False
+        else:
+            for form, model in changes:
+                self.after_model_change(form, model, False)
+
+        return True
+
     def delete_model(self, model: T_SQLALCHEMY_MODEL) -> bool:
         """
         Delete model.
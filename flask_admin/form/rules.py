@@ -1,6 +1,9 @@
+import re
 import typing as t
 from collections.abc import Generator
 
+from jinja2 import Environment
+from jinja2 import Template
 from jinja2.runtime import Context
 from markupsafe import Markup
 from wtforms import Field as WTField
@@ -14,6 +17,30 @@ from flask_admin._types import T_MODEL_VIEW
 from flask_admin._types import T_RULES_SEQUENCE
 from flask_admin._types import T_TRANSLATABLE
 
+# Macro names that can be used as Jinja expressions
+_macro_name_re = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$")
+
+
+def _get_field(form: Form, field_name: str) -> WTField:
+    field = getattr(form, field_name, None)
+
+    if field is None:
+        raise ValueError(f"Form {form} does not have field {field_name}")
+
+    return field
+
+
+def _get_field_args(
+    form_opts: t.Union[T_FORM_OPTS, None], field_name: str, field_args: t.Any
+) -> dict[str, t.Any]:
+    opts = {}
+
+    if form_opts:
+        opts.update(form_opts.widget_args.get(field_name, {}))
+
+    opts.update(field_args)
+    return opts
+
 
 class BaseRule:
     """
@@ -380,17 +407,8 @@ class Field(Macro):
         """
         if field_args is None:
             field_args = {}
-        field = getattr(form, self.field_name, None)
-
-        if field is None:
-            raise ValueError(f"Form {form} does not have field {self.field_name}")
-
-        opts = {}
-
-        if form_opts:
-            opts.update(form_opts.widget_args.get(self.field_name, {}))
-
-        opts.update(field_args)
+        field = _get_field(form, self.field_name)
+        opts = _get_field_args(form_opts, self.field_name, field_args)
 
         params = {"form": form, "field": field, "kwargs": opts}
 
@@ -622,6 +640,10 @@ class RuleSet:
         self.view = view
         self.rules = self.configure_rules(rules)
 
+        self.compiled_source: str | None = None
+        self._compiled_rules: list[BaseRule] = []
+        self._template: tuple[Environment, Template] | None = None
+
     @property
     def visible_fields(self) -> list[str]:
         visible_fields = []
@@ -673,3 +695,111 @@ class RuleSet:
         Iterate through registered rules.
         """
         yield from self.rules
+
+    def compile(self) -> None:
+        """
+        Compile the rules to a Jinja template, so `render` renders the form
+        with a single template call instead of walking the rules and
+        resolving their macros for every form.
+
+        Rules that can not be expressed in Jinja, like `Row`, `Group` or
+        rules with a custom `__call__`, are called from the template.
+        """
+        self._compiled_rules = []
+        body = "".join(self._compile_rule(r, "{}", False) for r in self.rules)
+
+        self.compiled_source = f"{{% autoescape true %}}{body}{{% endautoescape %}}"
+        self._template = None
+
+    def _compile_rule(self, rule: BaseRule, field_args: str, nested: bool) -> str:
+        """
+        Return Jinja source rendering the rule like its `__call__` does.
+
+        :param rule:
+            Rule to compile
+        :param field_args:
+            Jinja expression of the field arguments passed to the rule
+        :param nested:
+            Rendered by a `NestedRule`, which does not escape its children
+        """
+        ref = f"_rules[{len(self._compiled_rules)}]"
+        self._compiled_rules.append(rule)
+
+        rule_type = type(rule)
+        macro_name = getattr(rule, "macro_name", None)
+        is_macro = (
+            isinstance(rule, Macro)
+            and type(rule)._resolve is Macro._resolve
+            and _macro_name_re.match(macro_name or "") is not None
+        )
+
+        if rule_type.__call__ is NestedRule.__call__:
+            separator = f"{{{{ {ref}.separator|safe }}}}"
+            return separator.join(
+                self._compile_rule(r, field_args, True)
+                for r in rule.rules  # type: ignore[attr-defined]
+            )
+        elif rule_type.__call__ is Text.__call__:
+            if rule.escape and not nested:  # type: ignore[attr-defined]
+                return f"{{{{ {ref}.text }}}}"
+            return f"{{{{ {ref}.text|string|safe }}}}"
+        elif is_macro and rule_type.__call__ is Macro.__call__:
+            return f"{{{{ {macro_name}(**dict({ref}.default_args, **{field_args})) }}}}"
+        elif is_macro and rule_type.__call__ is Field.__call__:
+            return (
+                f"{{{{ {macro_name}(**dict({ref}.default_args, form=form, "
+                f"field=_get_field(form, {ref}.field_name), "
+                f"kwargs=_get_field_args(form_opts, {ref}.field_name, {field_args})"
+                ")) }}"
+            )
+        elif is_macro and rule_type.__call__ is Container.__call__:
+            # The child gets the arguments the macro passes to `caller`
+            child = self._compile_rule(
+                rule.child_rule,  # type: ignore[attr-defined]
+                "_field_args",
+                False,
+            )
+            return (
+                f"{{% call {macro_name}(**dict({ref}.default_args, **{field_args})) %}}"
+                f"{{% set _field_args = kwargs %}}{child}{{% endcall %}}"
+            )
+
+        call = f"{ref}(form, form_opts, {field_args})"
+        if nested:
+            call += "|string|safe"
+        return f"{{{{ {call} }}}}"
+
+    def render(
+        self, form: Form, form_opts: t.Union[T_FORM_OPTS, None] = None
+    ) -> Markup:
+        """
+        Render the form with the template made by `compile`.
+
+        :param form:
+            Form object
+        :param form_opts:
+            Form options
+        """
+        if self.compiled_source is None:
+            raise ValueError("Rule set was not compiled.")
+
+        context = helpers.get_render_ctx()
+        if context is None:
+            raise Exception(
+                'Your template is missing "{% set render_ctx = h.resolve_ctx() %}"'
+            )
+
+        env = context.environment
+        if self._template is None or self._template[0] is not env:
+            self._template = (env, env.from_string(self.compiled_source))
+
+        return Markup(
+            self._template[1].render(
+                context.get_all(),
+                form=form,
+                form_opts=form_opts,
+                _rules=self._compiled_rules,
+                _get_field=_get_field,
+                _get_field_args=_get_field_args,
+            )
+        )
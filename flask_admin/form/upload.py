@@ -21,13 +21,6 @@ from flask_admin._types import T_VALIDATOR
 from flask_admin.babel import gettext
 from flask_admin.helpers import get_url
 
-try:
-    from PIL import Image
-    from PIL import ImageOps
-except ImportError:
-    Image = None  # type:ignore[assignment]
-    ImageOps = None  # type:ignore[assignment]
-
 __all__ = [
     "FileUploadInput",
     "FileUploadField",
@@ -38,6 +31,20 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> t.Any:
+    # Pillow is slow to import, so it is only imported by image upload fields
+    if name in ("Image", "ImageOps"):
+        try:
+            from PIL import Image
+            from PIL import ImageOps
+        except ImportError:
+            return None
+
+        return Image if name == "Image" else ImageOps
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Widgets
 class FileUploadInput:
     """
@@ -444,11 +451,13 @@ class ImageUploadField(FileUploadField):
             to 'static'.
         """
         # Check if PIL is installed
-        if Image is None:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
             raise Exception(
                 "Could not import `PIL`. "
                 "Enable `images` integration by installing `flask-admin[images]`"
-            )
+            ) from None
 
         self.max_size = max_size
         self.thumbnail_fn = thumbgen or thumbgen_filename
@@ -475,6 +484,8 @@ class ImageUploadField(FileUploadField):
         super().pre_validate(form)
 
         if self._is_uploaded_file(self.data):
+            from PIL import Image
+
             try:
                 self.image = Image.open(self.data)  # type:ignore[arg-type]
             except Exception as e:
@@ -529,6 +540,9 @@ class ImageUploadField(FileUploadField):
             )
 
     def _resize(self, image: T_PIL_IMAGE, size: tuple[int, int, bool]) -> T_PIL_IMAGE:
+        from PIL import Image
+        from PIL import ImageOps
+
         (width, height, force) = size
 
         if image.size[0] > width or image.size[1] > height:
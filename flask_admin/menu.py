@@ -1,5 +1,7 @@
 import typing as t
 
+from flask import g
+from flask import has_request_context
 from flask import url_for
 
 from flask_admin._types import T_MODEL_VIEW
@@ -141,13 +143,26 @@ class MenuView(BaseMenu):
         if self._view is None:
             return False
 
-        return self._view.is_visible()
+        return self._check_view("is_visible")
 
     def is_accessible(self) -> bool:
         if self._view is None:
             return False
 
-        return self._view.is_accessible()
+        return self._check_view("is_accessible")
+
+    def _check_view(self, name: str) -> bool:
+        # Remember the result for the current request, menus check every
+        # item several times per page
+        if not has_request_context():
+            return getattr(self._view, name)()
+
+        checks = g.setdefault("_admin_menu_checks", {})
+        key = (id(self._view), name)
+        if key not in checks:
+            checks[key] = getattr(self._view, name)()
+
+        return checks[key]
 
 
 class MenuLink(BaseMenu):
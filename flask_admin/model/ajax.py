@@ -1,3 +1,4 @@
+import inspect
 import typing as t
 
 from flask_admin._types import T_ORM_MODEL
@@ -10,6 +11,10 @@ class AjaxModelLoader:
     Ajax related model loader. Override this to implement custom loading behavior.
     """
 
+    #: Whether `get_list` can continue from the primary key of the last model
+    #: of the previous page (keyset pagination) instead of using an offset.
+    supports_keyset = False
+
     def __init__(self, name: str, options: dict[t.Any, t.Any]) -> None:
         """
         Constructor.
@@ -20,6 +25,19 @@ class AjaxModelLoader:
         self.name = name
         self.options = options
 
+        # Subclasses often override `get_list` without the `after` argument,
+        # they are paginated by offset even if `supports_keyset` is inherited
+        parameters = inspect.signature(self.get_list).parameters
+        self._get_list_accepts_after = "after" in parameters or any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+        )
+
+    def can_use_keyset(self) -> bool:
+        """
+        Return True if `get_list` can be called with the `after` argument.
+        """
+        return self.supports_keyset and getattr(self, "_get_list_accepts_after", False)
+
     def format(self, model: T_ORM_MODEL | None) -> tuple[t.Any, str] | None:
         """
         Return (id, name) tuple from the model.
@@ -35,8 +53,33 @@ class AjaxModelLoader:
         """
         raise NotImplementedError()
 
+    def get_many(self, pks: t.Iterable[t.Any]) -> list[t.Any]:
+        """
+        Find models by their primary keys.
+
+        Models that could not be found are omitted from the result. Default
+        implementation calls :meth:`get_one` for every key, override it to
+        load all models with a single query.
+
+        :param pks:
+            Primary key values
+        """
+        result = []
+
+        for pk in pks:
+            model = self.get_one(pk)
+
+            if model is not None:
+                result.append(model)
+
+        return result
+
     def get_list(
-        self, query: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: t.Any = None,
     ) -> list[T_ORM_MODEL]:
         """
         Return models that match `query`.
@@ -49,5 +92,9 @@ class AjaxModelLoader:
             Offset
         :param limit:
             Limit
+        :param after:
+            Primary key of the last model of the previous page. Only used
+            when `supports_keyset` is enabled, in which case it replaces
+            `offset`.
         """
         raise NotImplementedError()
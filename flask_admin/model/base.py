@@ -1,50 +1,44 @@
 from __future__ import annotations
 
 import csv
-import inspect
+import hashlib
 import mimetypes
 import re
+import threading
 import time
+import tracemalloc
 import typing as t
 import warnings
 from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from contextlib import nullcontext
+from datetime import datetime
 from math import ceil
+from typing import TypeGuard  # noqa
+from urllib.parse import urlsplit
 
 from flask import abort
 from flask import current_app
 from flask import flash
+from flask import g
 from flask import get_flashed_messages
+from flask import has_request_context
 from flask import json
+from flask import make_response
 from flask import redirect
 from flask import request
+from flask import session
 from flask import stream_with_context
 from jinja2 import pass_context
 from jinja2.runtime import Context
 from markupsafe import Markup
 from werkzeug import Response
+from werkzeug.datastructures import MultiDict
+from werkzeug.http import is_resource_modified
+from werkzeug.routing import BuildError
 from werkzeug.utils import secure_filename
-
-from .._types import T_COLUMN
-from .._types import T_COLUMN_LIST
-from .._types import T_COLUMN_TYPE_FORMATTERS
-from .._types import T_FIELD_ARGS_VALIDATORS_FILES
-from .._types import T_FILTER
-from .._types import T_INSTRUMENTED_ATTRIBUTE
-from .._types import T_ORM_MODEL
-from .._types import T_QUERY_AJAX_MODEL_LOADER
-from .._types import T_RESPONSE
-from .._types import T_RULES_SEQUENCE
-from .._types import T_WIDGET
-from ..form.rules import RuleSet
-from .filters import BaseFilter
-from .template import BaseListRowAction
-
-try:
-    import tablib
-except ImportError:
-    tablib = None
-from typing import TypeGuard  # noqa
-
 from wtforms.fields import HiddenField
 from wtforms.fields.core import Field
 from wtforms.fields.core import UnboundField
@@ -57,6 +51,7 @@ from flask_admin._compat import as_unicode
 from flask_admin._compat import csv_encode
 from flask_admin._compat import iteritems
 from flask_admin._compat import itervalues
+from flask_admin._compat import string_types
 from flask_admin._compat import text_type
 from flask_admin.actions import ActionsMixin
 from flask_admin.babel import gettext
@@ -66,23 +61,79 @@ from flask_admin.base import expose
 from flask_admin.form import BaseForm
 from flask_admin.form import FormOpts
 from flask_admin.form import rules
-from flask_admin.helpers import flash_errors, is_form_submitted
+from flask_admin.helpers import flash_errors
 from flask_admin.helpers import get_form_data
 from flask_admin.helpers import get_redirect_target
+from flask_admin.helpers import is_form_submitted
 from flask_admin.helpers import validate_form_on_submit
 from flask_admin.model import filters
 from flask_admin.model import template
 from flask_admin.model import typefmt
 from flask_admin.tools import rec_getattr
 
+from .._types import T_COLUMN
+from .._types import T_COLUMN_LIST
+from .._types import T_COLUMN_TYPE_FORMATTERS
+from .._types import T_FIELD_ARGS_VALIDATORS_FILES
+from .._types import T_FILTER
+from .._types import T_INSTRUMENTED_ATTRIBUTE
+from .._types import T_ORM_MODEL
+from .._types import T_QUERY_AJAX_MODEL_LOADER
+from .._types import T_RESPONSE
+from .._types import T_RULES_SEQUENCE
+from .._types import T_WIDGET
+from ..form.rules import RuleSet
 from .ajax import AjaxModelLoader
+from .filters import BaseFilter
 from .helpers import get_mdict_item_or_list
 from .helpers import prettify_name
+from .helpers import RequestTimer
+from .helpers import UrlTemplate
+from .template import BaseListRowAction
 
 # Used to generate filter query string name
 filter_char_re = re.compile("[^a-z0-9 ]")
 filter_compact_re = re.compile(" +")
 
+T = t.TypeVar("T")
+
+# Scaffolding results shared by views with `share_scaffolding`, by configuration
+_scaffold_cache: dict[t.Hashable, dict[str, t.Any]] = {}
+_scaffold_cache_lock = threading.Lock()
+
+# Session keys identifying the session in entity tags: the CSRF secrets of
+# WTForms and Flask-WTF, and the user of Flask-Login
+_session_identity_keys = ("csrf", "csrf_token", "_user_id")
+
+# Returned by `BaseModelView._timing` when nothing is measured
+_no_timing: AbstractContextManager[None] = nullcontext()
+
+
+def clear_scaffold_cache() -> None:
+    """
+    Forget scaffolding results shared by views with `share_scaffolding`.
+    Views that are already initialized keep their form classes and columns.
+    """
+    with _scaffold_cache_lock:
+        _scaffold_cache.clear()
+
+
+def _freeze_scaffold_value(value: t.Any) -> t.Any:
+    """
+    Convert a view setting to a hashable value for the scaffold cache key.
+    """
+    if isinstance(value, dict):
+        return tuple(
+            (_freeze_scaffold_value(k), _freeze_scaffold_value(v))
+            for k, v in value.items()
+        )
+    if isinstance(value, list | tuple):
+        return tuple(_freeze_scaffold_value(v) for v in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze_scaffold_value(v) for v in value)
+
+    return value
+
 
 class ViewArgs:
     """
@@ -128,6 +179,25 @@ class ViewArgs:
         return ViewArgs(**kwargs)
 
 
+class _ListForms(dict[t.Any, Form]):
+    """
+    Editable list forms by primary key, created when accessed.
+
+    The list template renders editable cells with a single form, this mapping
+    is kept for templates that still use one form per row.
+    """
+
+    def __init__(self, view: BaseModelView, rows: dict[t.Any, t.Any]) -> None:
+        super().__init__()
+
+        self.view = view
+        self.rows = rows
+
+    def __missing__(self, pk: t.Any) -> Form:
+        form = self[pk] = self.view.list_form(obj=self.rows[pk])
+        return form
+
+
 class FilterGroup:
     def __init__(self, label: str) -> None:
         self.label = label
@@ -211,6 +281,9 @@ class BaseModelView(BaseView, ActionsMixin):
     can_export: bool = False
     """Is model list export allowed"""
 
+    can_list_api: bool = False
+    """Is JSON list API (`list_api_view`) allowed"""
+
     # Templates
     list_template: str = "admin/model/list.html"
     """Default list view template"""
@@ -622,6 +695,173 @@ class BaseModelView(BaseView, ActionsMixin):
         prev/next pager buttons.
     """
 
+    column_version: str | None = None
+    """
+        Name of a column that changes every time a record is modified, for
+        example an `updated_at` timestamp or an integer version counter.
+
+        If set, the details and list views send `ETag` (and `Last-Modified`,
+        for date-time columns) headers and answer conditional requests with
+        `304 Not Modified` without rendering the page. The list view uses
+        the number of matching records and the maximum version as its
+        fingerprint.
+
+        For example::
+
+            class MyModelView(BaseModelView):
+                column_version = 'updated_at'
+
+        Supported by the SQLAlchemy backend.
+    """
+
+    cache_control: dict[str, t.Any] | None = None
+    """
+        `Cache-Control` directives sent with the list and details pages.
+
+        Meant for read-only views whose pages do not depend on the current
+        user, so they can be stored by a shared cache. For example::
+
+            class MyModelView(BaseModelView):
+                can_create = False
+                can_edit = False
+                can_delete = False
+                cache_control = {'public': True, 'max_age': 60}
+
+        Pages showing flash messages are always sent as `private, no-cache`.
+    """
+
+    cache_vary: t.Sequence[str] = ()
+    """
+        Additional request headers to list in the `Vary` header of the list and
+        details pages, for example `('Accept-Language',)`.
+    """
+
+    list_canonical_redirect: bool = False
+    """
+        Redirect list view requests to the canonical URL of the page.
+
+        Canonical URLs have sorted query parameters, omit default values and
+        number filters in a stable order, so shared caches see one URL per
+        page.
+    """
+
+    share_scaffolding: bool = False
+    """
+        Share scaffolded form classes and column lists with other views of the
+        same class, model and configuration, for example when the same view
+        is added to several `Admin` instances.
+
+        Views share results when all settings in `scaffold_cache_attributes`
+        are equal and hashable, the cache lives as long as the process, see
+        `flask_admin.model.base.clear_scaffold_cache`.
+    """
+
+    scaffold_cache_attributes: tuple[str, ...] = (
+        "column_list",
+        "column_exclude_list",
+        "column_details_list",
+        "column_details_exclude_list",
+        "column_export_list",
+        "column_export_exclude_list",
+        "column_labels",
+        "column_descriptions",
+        "column_display_pk",
+        "column_editable_list",
+        "form",
+        "form_base_class",
+        "form_args",
+        "form_columns",
+        "form_excluded_columns",
+        "form_overrides",
+        "form_extra_fields",
+        "form_ajax_refs",
+    )
+    """
+        Settings that scaffolding depends on, used to find views that can
+        share scaffolding results. Extend it when overriding scaffolding
+        methods to depend on other settings.
+    """
+
+    lazy_scaffolding: bool = False
+    """
+        Defer scaffolding of columns, forms and filters until the first request
+        to the view. Menus only need the view name, category and URL, so
+        applications with many views start faster.
+
+        Lazy views can be scaffolded ahead of time with `Admin.warm_up`, for
+        example in a background thread once the application has started.
+    """
+
+    list_fragments: bool = False
+    """
+        Replace only the table and pager of the list view when paging or
+        sorting, instead of reloading the whole page.
+
+        The table and pager are requested from the list view with the
+        `fragment=list` argument, which renders only the `model_list_table`
+        block of the list template. Such requests are served whether this
+        option is set or not.
+
+        Only pager and column header links are handled. Search and filter
+        forms still reload the whole page, and the links of the menu bar,
+        like the page size, export and filter form, keep the page and sort
+        order of the last full page load.
+    """
+
+    list_streaming: bool = False
+    """
+        Stream the list view to the client while it is being rendered, so
+        the page header and the first rows are shown before all rows have
+        been formatted.
+
+        Errors raised while rendering can not be turned into an error page
+        once the response has started.
+    """
+
+    server_timing: bool = False
+    """
+        Measure time spent in the steps of each request to the view and send
+        it in the `Server-Timing` response header, shown by the network panel
+        of browser developer tools.
+
+        Steps are `view` for the whole view function, `render`, `formatters`
+        for list cell values, `export` for building the export response,
+        `export_rows` for formatting the rows of a streamed CSV export and
+        `ajax_lookup`. SQLAlchemy views also measure `search` and `filters`
+        for building the list query, `count` for the count query, if it runs,
+        and `query` for the page query.
+
+        Timings reveal how long queries take, only enable this for trusted
+        users or during development. Steps that run while a streamed response
+        is sent, like `export_rows`, are not included in the header.
+    """
+
+    metrics_hook: t.Callable[[str, float, dict[str, str]], None] | None = None
+    """
+        Function called with the step name, the time spent in seconds and
+        labels for every step measured in a request to the view, see
+        `server_timing` for the steps. Labels are `view`, the endpoint of
+        the view, and `endpoint`, the endpoint of the request.
+
+        It is called once the response is complete, so it also reports steps
+        of streamed responses. For example, to record the timings in a
+        Prometheus histogram::
+
+            REQUEST_TIME = Histogram(
+                'admin_request_seconds', 'Admin request time',
+                ['step', 'view', 'endpoint'],
+            )
+
+            def observe(name, value, labels):
+                REQUEST_TIME.labels(step=name, **labels).observe(value)
+
+            class MyModelView(BaseModelView):
+                metrics_hook = staticmethod(observe)
+
+        Nothing is measured if neither `server_timing` nor `metrics_hook` is
+        set.
+    """
+
     form: type[Form] | None = None
     """
         Form class. Override if you want to use custom form for your model.
@@ -850,6 +1090,16 @@ class BaseModelView(BaseView, ActionsMixin):
         Customized rules for the create form. Override `form_rules` if present.
     """
 
+    form_rules_compiled: bool = False
+    """
+        Compile the form rules to a Jinja template when the view is
+        scaffolded, so the create and edit forms are rendered with a single
+        template call instead of walking the rules for every form.
+
+        Rules with a custom `__call__`, `Row` and `Group` are still called
+        from the compiled template.
+    """
+
     # Actions
     action_disallowed_list: t.Sequence[str] = t.cast(
         t.Sequence[str],
@@ -954,7 +1204,12 @@ class BaseModelView(BaseView, ActionsMixin):
         self.init_actions()
 
         # Scaffolding
-        self._refresh_cache()
+        self._scaffold_lock = threading.Lock()
+        self._scaffolded = False
+        self.scaffold_profile: dict[str, dict[str, t.Any]] = {}
+
+        if not self.lazy_scaffolding:
+            self.ensure_scaffolded()
 
         if self.can_set_page_size and self.page_size not in self.page_size_options:
             warnings.warn(
@@ -970,29 +1225,126 @@ class BaseModelView(BaseView, ActionsMixin):
 
         return self.model.__name__.lower()
 
+    def _run_view(
+        self, fn: t.Callable[..., t.Any], *args: t.Any, **kwargs: t.Any
+    ) -> t.Any:
+        self.ensure_scaffolded()
+
+        if not self.server_timing and self.metrics_hook is None:
+            return super()._run_view(fn, *args, **kwargs)
+
+        timer = g._admin_request_timer = RequestTimer()
+        with timer.step("view"):
+            response = make_response(super()._run_view(fn, *args, **kwargs))
+
+        if self.server_timing:
+            response.headers.add("Server-Timing", timer.get_server_timing())
+
+        if self.metrics_hook is not None:
+            labels = {"view": self.endpoint, "endpoint": request.endpoint or ""}
+
+            def report() -> None:
+                for name, value in timer.timings.items():
+                    self.metrics_hook(name, value, labels)  # type: ignore[misc]
+
+            # Streamed responses are rendered after the view returns
+            if response.is_streamed:
+                response.call_on_close(report)
+            else:
+                report()
+
+        return response
+
+    def _timing(self, name: str) -> AbstractContextManager[None]:
+        """
+        Measure time spent in step `name` of the current request, if the view
+        has `server_timing` or `metrics_hook`.
+
+        :param name:
+            Step name
+        """
+        if not self.server_timing and self.metrics_hook is None:
+            return _no_timing
+
+        timer = g.get("_admin_request_timer") if has_request_context() else None
+        if timer is None:
+            return _no_timing
+
+        return timer.step(name)
+
+    def render(self, template: str, **kwargs: t.Any) -> str:
+        with self._timing("render"):
+            return super().render(template, **kwargs)
+
     # Caching
+    def ensure_scaffolded(self) -> None:
+        """
+        Scaffold columns, forms and filters of the view, unless it was
+        already done. Only does work for views with `lazy_scaffolding`.
+        """
+        if self._scaffolded:
+            return
+
+        with self._scaffold_lock:
+            if not self._scaffolded:
+                with self._scaffold_step("_refresh_cache"):
+                    self._refresh_cache()
+                self._scaffolded = True
+
+    @contextmanager
+    def _scaffold_step(self, name: str) -> Iterator[None]:
+        """
+        Record time spent in a scaffolding step in `scaffold_profile`, and
+        the memory it allocated if `tracemalloc` is tracing.
+        """
+        tracing = tracemalloc.is_tracing()
+        memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.scaffold_profile[name] = {
+                "time": time.perf_counter() - start,
+                "memory": (
+                    tracemalloc.get_traced_memory()[0] - memory if tracing else None
+                ),
+            }
+
     def _refresh_forms_cache(self) -> None:
         # Forms
-        self._form_ajax_refs: dict[str, AjaxModelLoader | T_QUERY_AJAX_MODEL_LOADER] = (
-            self._process_ajax_references()
-        )
+        with self._scaffold_step("_process_ajax_references"):
+            self._form_ajax_refs: dict[
+                str, AjaxModelLoader | T_QUERY_AJAX_MODEL_LOADER
+            ] = self._process_ajax_references()
 
         if self.form_widget_args is None:
             self.form_widget_args = {}
 
-        self._create_form_class = self.get_create_form()
-        self._edit_form_class = self.get_edit_form()
+        with self._scaffold_step("get_create_form"):
+            self._create_form_class = self._get_scaffolded(
+                "create_form", self.get_create_form
+            )
+        with self._scaffold_step("get_edit_form"):
+            self._edit_form_class = self._get_scaffolded(
+                "edit_form", self.get_edit_form
+            )
         self._delete_form_class = self.get_delete_form()
         self._action_form_class = self.get_action_form()
 
         # List View In-Line Editing
+        self._list_form_field_classes: dict[str, type[Form]] = {}
         if self.column_editable_list:
-            self._list_form_class = self.get_list_form()
+            with self._scaffold_step("get_list_form"):
+                self._list_form_class = self._get_scaffolded(
+                    "list_form", self.get_list_form
+                )
         else:
             self.column_editable_list = {}
 
     def _refresh_filters_cache(self) -> None:
-        self._filters = self.get_filters()
+        with self._scaffold_step("get_filters"):
+            self._filters = self.get_filters()
 
         if self._filters:
             self._filter_groups: OrderedDict[str, FilterGroup] | None = OrderedDict()
@@ -1039,20 +1391,73 @@ class BaseModelView(BaseView, ActionsMixin):
             if not self._form_edit_rules:
                 self._form_edit_rules = form_rules
 
+        if self.form_rules_compiled:
+            for rule_set in {self._form_create_rules, self._form_edit_rules}:
+                if rule_set is not None:
+                    rule_set.compile()
+
+    def get_scaffold_cache_key(self) -> t.Hashable | None:
+        """
+        Return key of the scaffolding configuration of the view, or None if
+        scaffolding results can not be shared with other views.
+        """
+        key = (
+            type(self),
+            self.model,
+            tuple(
+                _freeze_scaffold_value(getattr(self, name, None))
+                for name in self.scaffold_cache_attributes
+            ),
+        )
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def _get_scaffolded(self, name: str, factory: t.Callable[[], T]) -> T:
+        """
+        Return scaffolding result shared with views of the same configuration,
+        calling `factory` to create it the first time.
+        """
+        key = getattr(self, "_scaffold_cache_key", None)
+        if key is None:
+            return factory()
+
+        with _scaffold_cache_lock:
+            results = _scaffold_cache.get(key, {})
+            if name in results:
+                return results[name]
+
+        value = factory()
+
+        with _scaffold_cache_lock:
+            return _scaffold_cache.setdefault(key, {}).setdefault(name, value)
+
     def _refresh_cache(self) -> None:
         """
         Refresh various cached variables.
         """
+        self._scaffold_cache_key = (
+            self.get_scaffold_cache_key() if self.share_scaffolding else None
+        )
+
         # List view
-        self._list_columns = self.get_list_columns()
+        self._list_columns = self._get_scaffolded("list_columns", self.get_list_columns)
         self._sortable_columns = self.get_sortable_columns()
 
         # Details view
         if self.can_view_details:
-            self._details_columns = self.get_details_columns()
+            self._details_columns = self._get_scaffolded(
+                "details_columns", self.get_details_columns
+            )
 
         # Export view
-        self._export_columns = self.get_export_columns()
+        self._export_columns = self._get_scaffolded(
+            "export_columns", self.get_export_columns
+        )
 
         # Labels
         if self.column_labels is None:
@@ -1092,6 +1497,15 @@ class BaseModelView(BaseView, ActionsMixin):
         if self.column_type_formatters_detail is None:
             self.column_type_formatters_detail = dict(typefmt.DETAIL_FORMATTERS)
 
+        self._type_formatters = {
+            id(formatters): typefmt.TypeFormatterDispatch(formatters)
+            for formatters in (
+                self.column_type_formatters,
+                self.column_type_formatters_export,
+                self.column_type_formatters_detail,
+            )
+        }
+
         if self.column_descriptions is None:
             self.column_descriptions = dict()
 
@@ -1099,7 +1513,8 @@ class BaseModelView(BaseView, ActionsMixin):
         self._refresh_filters_cache()
 
         # Form rendering rules
-        self._refresh_form_rules_cache()
+        with self._scaffold_step("_refresh_form_rules_cache"):
+            self._refresh_form_rules_cache()
 
         # Process form rules
         self._validate_form_class(self._form_edit_rules, self._edit_form_class)
@@ -1736,6 +2151,33 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplementedError("Please implement get_one method")
 
+    def get_one_for_display(self, id: t.Any, view: str) -> T_ORM_MODEL | None:
+        """
+        Return one model by its id for the edit or details view.
+
+        Same as `get_one` by default. Backends can override it to load the
+        data displayed by the view up front.
+
+        :param id:
+            Model id
+        :param view:
+            Name of the view, "details" or "edit"
+        """
+        return self.get_one(id)
+
+    def get_many(self, ids: t.Sequence[t.Any]) -> list[T_ORM_MODEL]:
+        """
+        Return models by their ids. Missing models are omitted.
+
+        Default implementation calls `get_one` for every id, model backends
+        override it to load all models with a single query.
+
+        :param ids:
+            List of model ids
+        """
+        models = [self.get_one(id) for id in ids]
+        return [model for model in models if model is not None]
+
     # Exception handler
     def handle_view_exception(self, exc: Exception) -> bool:
         if isinstance(exc, ValidationError):
@@ -1888,6 +2330,21 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplementedError()
 
+    def update_models(self, changes: t.Sequence[tuple[Form, T_ORM_MODEL]]) -> bool:
+        """
+        Update several models from forms, used by the batch update of the
+        editable list view.
+
+        Returns `True` if all models were updated. Default implementation
+        calls `update_model` for every change, model backends override it to
+        save all changes in a single transaction.
+
+        :param changes:
+            List of tuples with form and model instance
+        """
+        results = [self.update_model(form, model) for form, model in changes]
+        return all(results)
+
     def delete_model(self, model: T_ORM_MODEL) -> bool:
         """
         Delete model.
@@ -1977,6 +2434,7 @@ class BaseModelView(BaseView, ActionsMixin):
                         "sort",
                         "desc",
                         "search",
+                        "fragment",
                     )
                     and not k.startswith("flt")
                 ]
@@ -1993,7 +2451,9 @@ class BaseModelView(BaseView, ActionsMixin):
         kwargs = {}
 
         if filters:
-            for i, pair in enumerate(filters):
+            # Number filters in a stable order, so the same set of filters
+            # always produces the same URL
+            for i, pair in enumerate(sorted(filters, key=lambda f: (f[0], f[2]))):
                 idx, flt_name, value = pair
 
                 key = "flt%d_%s" % (
@@ -2019,16 +2479,65 @@ class BaseModelView(BaseView, ActionsMixin):
         desc = 1 if view_args.sort_desc else None
 
         kwargs = dict(
-            page=page, sort=view_args.sort, desc=desc, search=view_args.search
+            page=page, sort=view_args.sort, desc=desc, search=view_args.search or None
         )
         kwargs.update(view_args.extra_args)
 
-        kwargs["page_size"] = self.get_safe_page_size(view_args.page_size)
+        page_size = self.get_safe_page_size(view_args.page_size)
+        if page_size != self.page_size:
+            kwargs["page_size"] = page_size
 
         kwargs.update(self._get_filters(view_args.filters))
 
+        # Sort arguments and drop empty ones to get a single URL for a page
+        kwargs = {k: v for k, v in sorted(kwargs.items()) if v is not None}
+
         return self.get_url(".index_view", **kwargs)
 
+    def _get_row_url_builder(self) -> t.Callable[..., str]:
+        """
+        Return `get_row_url(endpoint, row_id, id_arg='id', **kwargs)` helper
+        for the list template.
+
+        URL for every combination of endpoint and arguments is generated only
+        once, the row id is substituted into it for every row.
+        """
+        # None for endpoints that can not be built with the placeholder
+        templates: dict[t.Any, UrlTemplate | None] = {}
+
+        def get_row_url(
+            endpoint: str, row_id: t.Any, id_arg: str = "id", **kwargs: t.Any
+        ) -> str:
+            try:
+                key = (endpoint, id_arg, tuple(sorted(kwargs.items())))
+                built = key in templates
+            except TypeError:
+                # Unhashable arguments
+                return self.get_url(endpoint, **{id_arg: row_id}, **kwargs)
+
+            if built:
+                template = templates[key]
+            else:
+                try:
+                    url = self.get_url(
+                        endpoint, **{id_arg: UrlTemplate.placeholder}, **kwargs
+                    )
+                except (ValueError, BuildError):
+                    # Typed URL converters, like `<int:id>`, reject the
+                    # placeholder
+                    template = None
+                else:
+                    template = UrlTemplate(url)
+
+                templates[key] = template
+
+            if template is None:
+                return self.get_url(endpoint, **{id_arg: row_id}, **kwargs)
+
+            return template(row_id)
+
+        return get_row_url
+
     # Actions
     def is_action_allowed(self, name: str) -> bool:
         """
@@ -2078,29 +2587,28 @@ class BaseModelView(BaseView, ActionsMixin):
         if choices_map:
             return choices_map.get(value) or value
 
-        type_fmt = None
-        for typeobj, formatter in column_type_formatters.items():
-            if isinstance(value, typeobj):
-                type_fmt = formatter
-                break
+        type_fmt = self._get_type_formatter(column_type_formatters, value)
         if type_fmt is not None:
-            try:
-                value = type_fmt(self, value, name)
-            except TypeError:
-                spec = inspect.getfullargspec(type_fmt)
+            value = type_fmt(self, value, name)
 
-                if len(spec.args) == 2:
-                    warnings.warn(
-                        f"Please update your type formatter {type_fmt} to "
-                        "include additional `name` parameter.",
-                        stacklevel=1,
-                    )
-                else:
-                    raise
+        return value
 
-                value = type_fmt(self, value)  # type: ignore[call-arg]
+    def _get_type_formatter(
+        self, column_type_formatters: T_COLUMN_TYPE_FORMATTERS, value: t.Any
+    ) -> t.Callable[..., t.Any] | None:
+        """
+        Return type formatter for a value using type lookup cached since the
+        last `_refresh_cache` call.
+        """
+        dispatch = self._type_formatters.get(id(column_type_formatters))
 
-        return value
+        if dispatch is None or dispatch.formatters is not column_type_formatters:
+            # Formatters replaced after scaffolding or passed by a custom
+            # formatter, keep them for the next values
+            dispatch = typefmt.TypeFormatterDispatch(column_type_formatters)
+            self._type_formatters[id(column_type_formatters)] = dispatch
+
+        return dispatch.get(value)
 
     @pass_context
     def get_list_value(self, context: Context, model: T_ORM_MODEL, name: str) -> t.Any:
@@ -2114,6 +2622,16 @@ class BaseModelView(BaseView, ActionsMixin):
         :param name:
             Field name
         """
+        if self.server_timing or self.metrics_hook is not None:
+            with self._timing("formatters"):
+                return self._get_list_value(
+                    context,
+                    model,
+                    name,
+                    self.column_formatters,
+                    self.column_type_formatters,  # type: ignore[arg-type]
+                )
+
         return self._get_list_value(
             context,
             model,
@@ -2202,9 +2720,131 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         raise NotImplementedError()
 
+    # Conditional requests
+    def get_one_version(self, id: t.Any) -> t.Any:
+        """
+        Return the value of `column_version` for a model without loading it
+        or None, if the version is not known.
+
+        Model backends override this to support conditional requests in the
+        details view.
+
+        :param id:
+            Model id
+        """
+        return None
+
+    def get_list_version(
+        self, search: str | None, filters: t.Sequence[T_FILTER] | None
+    ) -> t.Any:
+        """
+        Return a fingerprint of the records matching the list view query or
+        None, if it is not known. Backends return a tuple with the number of
+        records and the maximum value of `column_version`.
+
+        :param search:
+            Search query
+        :param filters:
+            List of filter tuples
+        """
+        return None
+
+    def get_version_etag(self, version: t.Any) -> str:
+        """
+        Return the entity tag sent for a version.
+
+        The tag also depends on the CSRF secret and the logged in user stored
+        in the session, so pages with embedded CSRF tokens are not reused by
+        another session.
+
+        Override this method if the page depends on more than the data, for
+        example if the rendered columns vary per user role::
+
+            def get_version_etag(self, version):
+                return super().get_version_etag((version, current_user.role))
+
+        :param version:
+            Value returned by `get_one_version` or `get_list_version`
+        """
+        identity = tuple(session.get(key) for key in _session_identity_keys)
+        key = repr((self.endpoint, version, identity)).encode("utf-8")
+        return hashlib.md5(key, usedforsecurity=False).hexdigest()
+
+    def _get_version_headers(self, version: t.Any) -> dict[str, t.Any]:
+        last_modified = version[-1] if isinstance(version, tuple) else version
+
+        headers: dict[str, t.Any] = {"etag": self.get_version_etag(version)}
+        if isinstance(last_modified, datetime):
+            headers["last_modified"] = last_modified
+
+        return headers
+
+    def _set_cache_headers(
+        self, response: Response, version: t.Any, cacheable: bool = True
+    ) -> Response:
+        if version is not None:
+            headers = self._get_version_headers(version)
+
+            response.set_etag(headers["etag"])
+            if "last_modified" in headers:
+                response.last_modified = headers["last_modified"]
+
+        if self.cache_control and cacheable:
+            for directive, value in iteritems(self.cache_control):
+                setattr(response.cache_control, directive, value)
+        elif version is not None or self.cache_control:
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+
+        response.vary.update(self.cache_vary)
+        return response
+
+    def _get_not_modified_response(self, version: t.Any) -> Response | None:
+        """
+        Return `304 Not Modified` response if the client has the current
+        version of the page.
+        """
+        # Pending flash messages have to be rendered
+        if version is None or get_flashed_messages():
+            return None
+
+        if is_resource_modified(request.environ, **self._get_version_headers(version)):
+            return None
+
+        return self._set_cache_headers(Response(status=304), version)
+
+    def _render_cacheable(
+        self, version: t.Any, template: str, stream: bool = False, **kwargs: t.Any
+    ) -> T_RESPONSE | str:
+        # Pages with flash messages must not end up in shared caches
+        cacheable = not get_flashed_messages()
+
+        body: Response | str
+        if stream:
+            body = self.stream(template, **kwargs)
+        else:
+            body = self.render(template, **kwargs)
+
+        if version is None and not self.cache_control and not self.cache_vary:
+            return body
+
+        return self._set_cache_headers(make_response(body), version, cacheable)
+
+    def _get_canonical_list_redirect(self, view_args: ViewArgs) -> T_RESPONSE | None:
+        """
+        Return redirect to the canonical URL of the list page if the query
+        string of the current request differs from it.
+        """
+        url = self._get_list_url(view_args)
+
+        if urlsplit(url).query == request.query_string.decode("utf-8"):
+            return None
+
+        return redirect(url)
+
     # Views
     @expose("/")
-    def index_view(self) -> str:
+    def index_view(self) -> T_RESPONSE | str:
         """
         List view
         """
@@ -2216,6 +2856,14 @@ class BaseModelView(BaseView, ActionsMixin):
         # Grab parameters from URL
         view_args = self._get_list_extra_args()
 
+        # Render only the table and pager
+        list_fragment = request.args.get("fragment") == "list"
+
+        if self.list_canonical_redirect and not list_fragment:
+            canonical_redirect = self._get_canonical_list_redirect(view_args)
+            if canonical_redirect is not None:
+                return canonical_redirect
+
         # Map column index to column name
         sort_column_tuple = self._get_column_by_idx(view_args.sort)
         if sort_column_tuple is not None:
@@ -2226,6 +2874,14 @@ class BaseModelView(BaseView, ActionsMixin):
         # Get page size
         page_size = self.get_safe_page_size(view_args.page_size)
 
+        version = None
+        if self.column_version:
+            version = self.get_list_version(view_args.search, view_args.filters)
+
+            not_modified = self._get_not_modified_response(version)
+            if not_modified is not None:
+                return not_modified
+
         # Get count and data
         data: list[T_ORM_MODEL]
         count, data = self.get_list(
@@ -2237,10 +2893,42 @@ class BaseModelView(BaseView, ActionsMixin):
             page_size=page_size,
         )
 
-        list_forms = {}
+        # Primary keys are used several times per row, get them only once
+        data = list(data)
+        row_ids = {id(row): self.get_pk_value(row) for row in data}
+
+        def get_pk_value(row: T_ORM_MODEL) -> t.Any:
+            key = id(row)
+            if key in row_ids:
+                return row_ids[key]
+
+            return self.get_pk_value(row)
+
+        # Editable cells are rendered by a single form, field data is replaced
+        # for every cell. Custom `list_form` implementations may depend on the
+        # row, they get one form per row.
+        list_form = None
+        list_forms: dict[t.Any, Form] = {}
+        shared_list_form = type(self).list_form is BaseModelView.list_form
         if self.column_editable_list:
-            for row in data:
-                list_forms[self.get_pk_value(row)] = self.list_form(obj=row)
+            list_forms = _ListForms(self, {row_ids[id(row)]: row for row in data})
+            if shared_list_form:
+                list_form = self.list_form()
+            elif data:
+                list_form = list_forms[row_ids[id(data[0])]]
+
+        def get_list_form_field(row: T_ORM_MODEL, name: str) -> Field:
+            if not shared_list_form:
+                return list_forms[get_pk_value(row)][name]
+
+            field = list_form[name]  # type: ignore[index]
+
+            if hasattr(row, name):
+                field.process(None, getattr(row, name))
+            else:
+                field.process(None)
+
+            return field
 
         # Calculate number of pages
         if count is not None and page_size:
@@ -2250,19 +2938,33 @@ class BaseModelView(BaseView, ActionsMixin):
         else:
             num_pages = None  # use simple pager
 
-        # Various URL generation helpers
+        # Various URL generation helpers, list URLs are built once per request
+        first_page_url = self._get_list_url(view_args.clone(page=None))
+        page_url = UrlTemplate(
+            self._get_list_url(view_args.clone(page=UrlTemplate.placeholder))
+        )
+        sort_urls: dict[int | None, UrlTemplate] = {}
+
         def pager_url(p: int | None) -> str:
             # Do not add page number if it is first page
-            if p == 0:
-                p = None
+            if not p:
+                return first_page_url
 
-            return self._get_list_url(view_args.clone(page=p))
+            return page_url(p)
 
         def sort_url(column: str, invert: bool = False, desc: t.Any = None) -> str:
             if not desc and invert and not view_args.sort_desc:
                 desc = 1
 
-            return self._get_list_url(view_args.clone(sort=column, sort_desc=desc))
+            desc = 1 if desc else None
+            if desc not in sort_urls:
+                sort_urls[desc] = UrlTemplate(
+                    self._get_list_url(
+                        view_args.clone(sort=UrlTemplate.placeholder, sort_desc=desc)
+                    )
+                )
+
+            return sort_urls[desc](column)
 
         def page_size_url(s: int) -> str:
             if not s:
@@ -2287,10 +2989,14 @@ class BaseModelView(BaseView, ActionsMixin):
             )
         )
 
-        return self.render(
+        return self._render_cacheable(
+            version,
             self.list_template,
+            stream=self.list_streaming,
             data=data,
+            list_form=list_form,
             list_forms=list_forms,
+            get_list_form_field=get_list_form_field,
             delete_form=delete_form,
             action_form=action_form,  # List
             list_columns=self._list_columns,
@@ -2314,17 +3020,19 @@ class BaseModelView(BaseView, ActionsMixin):
             search=view_args.search,
             search_placeholder=self.search_placeholder(),  # Filters
             filters=self._filters,
-            filter_groups=self._get_filter_groups(),
+            filter_groups=None if list_fragment else self._get_filter_groups(),
             active_filters=view_args.filters,
             filter_args=self._get_filters(view_args.filters),  # Actions
             actions=actions,
             actions_confirmation=actions_confirmation,
             # Misc
             enumerate=enumerate,
-            get_pk_value=self.get_pk_value,
+            get_pk_value=get_pk_value,
+            get_row_url=self._get_row_url_builder(),
             get_value=self.get_list_value,
             return_url=self._get_list_url(view_args),  # Extras
             extra_args=view_args.extra_args,
+            list_fragment=list_fragment,
         )
 
     @expose("/new/", methods=("GET", "POST"))
@@ -2393,7 +3101,7 @@ class BaseModelView(BaseView, ActionsMixin):
         if id is None:
             return redirect(return_url)
 
-        model = self.get_one(id)
+        model = self.get_one_for_display(id, "edit")
 
         if model is None:
             flash(gettext("Record does not exist."), "error")
@@ -2450,7 +3158,15 @@ class BaseModelView(BaseView, ActionsMixin):
         if id is None:
             return redirect(return_url)
 
-        model = self.get_one(id)
+        version = None
+        if self.column_version:
+            version = self.get_one_version(id)
+
+            not_modified = self._get_not_modified_response(version)
+            if not_modified is not None:
+                return not_modified
+
+        model = self.get_one_for_display(id, "details")
 
         if model is None:
             flash(gettext("Record does not exist."), "error")
@@ -2461,7 +3177,8 @@ class BaseModelView(BaseView, ActionsMixin):
         else:
             template = self.details_template
 
-        return self.render(
+        return self._render_cacheable(
+            version,
             template,
             model=model,
             details_columns=self._details_columns,
@@ -2514,7 +3231,7 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         return self.handle_action()
 
-    def _export_data(self) -> tuple[int, list[T_ORM_MODEL]]:
+    def _validate_export_formatters(self, columns: list[tuple[T_COLUMN, str]]) -> None:
         # Macros in column_formatters are not supported.
         # Macros will have a function name 'inner'
         # This causes non-macro functions named 'inner' not work.
@@ -2522,7 +3239,7 @@ class BaseModelView(BaseView, ActionsMixin):
             self.column_formatters_export  # type: ignore[arg-type]
         ):
             # skip checking columns not being exported
-            if col not in [col for col, _ in self._export_columns]:
+            if col not in [col for col, _ in columns]:
                 continue
 
             if func.__name__ == "inner":
@@ -2532,6 +3249,9 @@ class BaseModelView(BaseView, ActionsMixin):
                     f" column_export_exclude_list. Column: {col}"
                 )
 
+    def _export_data(self) -> tuple[int, list[T_ORM_MODEL]]:
+        self._validate_export_formatters(self._export_columns)
+
         # Grab parameters from URL
         view_args = self._get_list_extra_args()
 
@@ -2562,10 +3282,11 @@ class BaseModelView(BaseView, ActionsMixin):
             flash(gettext("Permission denied."), "error")
             return redirect(return_url)
 
-        if export_type == "csv":
-            return self._export_csv(return_url)
-        else:
-            return self._export_tablib(export_type, return_url)
+        with self._timing("export"):
+            if export_type == "csv":
+                return self._export_csv(return_url)
+            else:
+                return self._export_tablib(export_type, return_url)
 
     def _export_csv(self, return_url: t.Any) -> T_RESPONSE:
         """
@@ -2596,10 +3317,11 @@ class BaseModelView(BaseView, ActionsMixin):
             yield writer.writerow(titles)
 
             for row in data:
-                vals = [
-                    csv_encode(self.get_export_value(row, c[0]))
-                    for c in self._export_columns
-                ]
+                with self._timing("export_rows"):
+                    vals = [
+                        csv_encode(self.get_export_value(row, c[0]))
+                        for c in self._export_columns
+                    ]
                 yield writer.writerow(vals)
 
         filename = self.get_export_name(export_type="csv")
@@ -2616,11 +3338,14 @@ class BaseModelView(BaseView, ActionsMixin):
         """
         Exports a variety of formats using the tablib library.
         """
-        if tablib is None:
+        # tablib is slow to import and only needed for exports
+        try:
+            import tablib
+        except ImportError:
             raise Exception(
                 "Could not import `tablib`. "
                 "Enable `export` integration by installing `flask-admin[export]`"
-            )
+            ) from None
 
         filename = self.get_export_name(export_type)
 
@@ -2661,30 +3386,236 @@ class BaseModelView(BaseView, ActionsMixin):
             mimetype=mimetype,
         )
 
+    def get_list_api_value(self, model: T_ORM_MODEL, name: T_COLUMN) -> t.Any:
+        """
+        Returns the value sent by the JSON list API. Uses the export
+        formatters, values that are not JSON types are converted to strings.
+
+        :param model:
+            Model instance
+        :param name:
+            Field name
+        """
+        value = self.get_export_value(model, name)
+
+        if value is None or isinstance(value, bool | int | float | str):
+            return value
+
+        return as_unicode(value)
+
+    @expose("/api/list/")
+    def list_api_view(self) -> T_RESPONSE:
+        """
+        List data as JSON. Accepts the sort, search, filter and page size
+        arguments of the list view and returns one page of rows::
+
+            {
+                "columns": ["name", "email"],
+                "labels": ["Name", "Email"],
+                "rows": [[<pk>, "<name>", "<email>"], ...],
+                "count": 120,
+                "cursor": "1"
+            }
+
+        The first value of every row is the primary key. Pass `cursor` back as
+        the `cursor` argument to get the next page, it is `null` on the last
+        page.
+        """
+        if not self.can_list_api:
+            abort(404)
+
+        view_args = self._get_list_extra_args()
+
+        cursor = request.args.get("cursor")
+        if cursor is not None:
+            if not cursor.isdigit():
+                abort(400)
+            view_args = view_args.clone(page=int(cursor))
+
+        sort_column_tuple = self._get_column_by_idx(view_args.sort)
+        if sort_column_tuple is not None:
+            sort_column = sort_column_tuple[0]
+        else:
+            sort_column = None
+
+        page_size = self.get_safe_page_size(view_args.page_size)
+        page = view_args.page or 0
+
+        version = None
+        if self.column_version:
+            version = self.get_list_version(view_args.search, view_args.filters)
+
+            not_modified = self._get_not_modified_response(version)
+            if not_modified is not None:
+                return not_modified
+
+        self._validate_export_formatters(self._list_columns)
+
+        data: list[T_ORM_MODEL]
+        count, data = self.get_list(
+            page,
+            sort_column,
+            view_args.sort_desc,
+            view_args.search,
+            view_args.filters,
+            page_size=page_size,
+        )
+
+        rows = []
+        for row in data:
+            values = [self.get_pk_value(row)]
+            values.extend(
+                self.get_list_api_value(row, c) for c, _ in self._list_columns
+            )
+            rows.append(values)
+
+        # Simple pager views do not count rows, a full page may have a next one
+        if not page_size:
+            has_next = False
+        elif count is not None:
+            has_next = (page + 1) * page_size < count
+        else:
+            has_next = len(rows) == page_size
+
+        result = dict(
+            columns=[c for c, _ in self._list_columns],
+            labels=[as_unicode(label) for _, label in self._list_columns],
+            rows=rows,
+            count=count,
+            cursor=str(page + 1) if has_next else None,
+        )
+
+        response = Response(json.dumps(result), mimetype="application/json")
+        return self._set_cache_headers(response, version)
+
     @expose("/ajax/lookup/")
     def ajax_lookup(self) -> T_RESPONSE:
         name = request.args.get("name")
         query = request.args.get("query")
         offset = request.args.get("offset", type=int)
         limit = request.args.get("limit", 10, type=int)
+        after = request.args.get("after")
 
         loader = self._form_ajax_refs.get(name)  # type: ignore[arg-type]
 
         if not loader:
             abort(404)
 
-        data = [
-            loader.format(m)
-            for m in loader.get_list(
-                query,  # type: ignore[arg-type]
-                offset,  # type: ignore[arg-type]
-                limit,
+        with self._timing("ajax_lookup"):
+            if after and loader.can_use_keyset():
+                models = loader.get_list(
+                    query,  # type: ignore[arg-type]
+                    limit=limit,
+                    after=after,
+                )
+            else:
+                models = loader.get_list(
+                    query,  # type: ignore[arg-type]
+                    offset,  # type: ignore[arg-type]
+                    limit,
+                )
+
+            data = [loader.format(m) for m in models]
+        return Response(json.dumps(data), mimetype="application/json")
+
+    def _get_list_form_field_class(self, name: str) -> type[Form] | None:
+        """
+        Return editable list form class with only the `name` field. Form
+        classes are cached per column.
+
+        :param name:
+            Field name
+        """
+        form_class = self._list_form_field_classes.get(name)
+
+        if form_class is None:
+            base_class = self._list_form_class
+            fields = [
+                n
+                for n in dir(base_class)
+                if isinstance(getattr(base_class, n), UnboundField)
+            ]
+
+            if name not in fields:
+                return None
+
+            # Fields set to None are removed from the subclass
+            attrs = dict(
+                (n, None)
+                for n in fields
+                if n not in (name, "list_form_pk", "csrf_token")
             )
+            form_class = type(base_class.__name__, (base_class,), attrs)
+            self._list_form_field_classes[name] = form_class
+
+        return form_class
+
+    def _get_ajax_update_form(self) -> Form:
+        """
+        Instantiate form for the submitted field of the editable list view.
+        """
+        names = [
+            name for name in request.form if name not in ("list_form_pk", "csrf_token")
         ]
-        return Response(json.dumps(data), mimetype="application/json")
+
+        # Custom `list_form` implementations get the full form
+        if len(names) == 1 and type(self).list_form is BaseModelView.list_form:
+            form_class = self._get_list_form_field_class(names[0])
+            if form_class is not None:
+                return form_class(get_form_data())
+
+        form = self.list_form()  # returns a form of all fields
+
+        # prevent validation issues due to submitting a single field
+        # delete all fields except the submitted fields and csrf token
+        for field in list(form):
+            if (field.name in request.form) or (field.name == "csrf_token"):
+                pass
+            else:
+                form.__delitem__(field.name)
+
+        return form
+
+    def _get_ajax_update_batch_form(
+        self, name: str, formdata: MultiDict[str, t.Any]
+    ) -> Form | None:
+        """
+        Instantiate form for one edit of the editable list batch update.
+
+        :param name:
+            Field name
+        :param formdata:
+            Submitted data of the edit
+        """
+        # Custom `list_form` implementations get the full form
+        if type(self).list_form is BaseModelView.list_form:
+            form_class = self._get_list_form_field_class(name)
+            return form_class(formdata) if form_class is not None else None
+
+        form = self.list_form()
+        if name not in form:
+            return None
+
+        # Only validate the edited field, like `_get_ajax_update_form`
+        for field in list(form):
+            if field.name not in (name, "list_form_pk", "csrf_token"):
+                form.__delitem__(field.name)
+
+        form.process(formdata)
+        return form
+
+    def _get_ajax_update_error(self, form: Form) -> str:
+        for field in form:
+            for error in field.errors:
+                if isinstance(error, list):
+                    error = ", ".join(error)
+
+                return gettext("Failed to update record. %(error)s", error=error)
+
+        return gettext("Failed to update record. %(error)s", error="")
 
     @expose("/ajax/update/", methods=("POST",))
-    def ajax_update(self) -> None | tuple[str, int] | str:
+    def ajax_update(self) -> tuple[str, int] | str:
         """
         Edits a single column of a record in list view. Usually used with
         `column_editable_list` that integrates with the x-editable library.
@@ -2712,15 +3643,7 @@ class BaseModelView(BaseView, ActionsMixin):
         if not self.column_editable_list:
             abort(404)
 
-        form = self.list_form()  # returns a form of all fields
-
-        # prevent validation issues due to submitting a single field
-        # delete all fields except the submitted fields and csrf token
-        for field in list(form):
-            if (field.name in request.form) or (field.name == "csrf_token"):
-                pass
-            else:
-                form.__delitem__(field.name)
+        form = self._get_ajax_update_form()
 
         if self.validate_form(form):
             pk = form.list_form_pk.data  # type: ignore[attr-defined]
@@ -2738,15 +3661,104 @@ class BaseModelView(BaseView, ActionsMixin):
                 msgs = ", ".join([msg for msg in get_flashed_messages()])  # type: ignore[misc]
                 return gettext("Failed to update record. %(error)s", error=msgs), 500
         else:
-            for field in form:
-                for error in field.errors:
-                    # return validation error to x-editable
-                    if isinstance(error, list):
-                        return gettext(
-                            "Failed to update record. %(error)s", error=", ".join(error)
-                        ), 500
-                    else:
-                        return gettext(
-                            "Failed to update record. %(error)s", error=error
-                        ), 500
-        return None
+            # return validation error to x-editable
+            return self._get_ajax_update_error(form), 500
+
+    @expose("/ajax/update/batch/", methods=("POST",))
+    def ajax_update_batch(self) -> T_RESPONSE:
+        """
+        Edits several cells of the editable list view at once. All records are
+        loaded with a single query and valid changes are saved together.
+
+        Accepts JSON object with a list of edits and returns the result for
+        every edit in the same order:
+
+        .. code-block:: javascript
+
+            $.ajax({
+                url: '/admin/<your_model_view_endpoint>/ajax/update/batch/',
+                type: 'POST',
+                contentType: 'application/json',
+                data: JSON.stringify({
+                    "csrf_token": "<csrf_token>",
+                    "edits": [
+                        {"pk": "<primary_key_value>", "field": "<column_name>",
+                         "value": "<new_value>"}
+                    ]
+                }),
+                success: function(response) {
+                    // {"results": [{"pk": ..., "field": ..., "success": true,
+                    //               "message": "Record was successfully saved."}]}
+                }
+            });
+        """
+        if not self.column_editable_list:
+            abort(404)
+
+        payload = request.get_json(silent=True)
+        edits = payload.get("edits") if isinstance(payload, dict) else None
+        if not isinstance(edits, list) or not all(isinstance(e, dict) for e in edits):
+            abort(400)
+
+        csrf_token = payload.get("csrf_token")  # type: ignore[union-attr]
+
+        ids = list(dict.fromkeys(str(edit.get("pk")) for edit in edits))
+        models = dict(
+            (as_unicode(self.get_pk_value(model)), model)
+            for model in self.get_many(ids)
+        )
+
+        results: list[dict[str, t.Any]] = []
+        changes = []
+
+        for edit in edits:
+            pk = str(edit.get("pk"))
+            name = edit.get("field")
+            value = edit.get("value")
+
+            result = dict(pk=edit.get("pk"), field=name, success=False)
+            results.append(result)
+
+            form = None
+            if isinstance(name, string_types) and self.is_editable(name):
+                formdata = MultiDict([("list_form_pk", pk)])
+                if isinstance(value, list):
+                    formdata.setlist(name, [as_unicode(v) for v in value])
+                elif value is not None:
+                    formdata[name] = as_unicode(value)
+                if csrf_token:
+                    formdata["csrf_token"] = csrf_token
+
+                form = self._get_ajax_update_batch_form(name, formdata)
+
+            if form is None:
+                result["message"] = gettext(
+                    "Failed to update record. %(error)s", error=name
+                )
+                continue
+
+            if not self.validate_form(form):
+                result["message"] = self._get_ajax_update_error(form)
+                continue
+
+            model = models.get(pk)
+            if model is None:
+                result["message"] = gettext("Record does not exist.")
+                continue
+
+            changes.append((form, model, result))
+
+        if changes:
+            if self.update_models([(form, model) for form, model, _ in changes]):
+                message = gettext("Record was successfully saved.")
+                success = True
+            else:
+                msgs = ", ".join([msg for msg in get_flashed_messages()])  # type: ignore[misc]
+                message = gettext("Failed to update record. %(error)s", error=msgs)
+                success = False
+
+            for _, _, result in changes:
+                result["success"] = success
+                result["message"] = message
+
+        return Response(json.dumps(dict(results=results)), mimetype="application/json")
@@ -246,16 +246,22 @@ class AjaxSelectMultipleField(AjaxSelectField):
     def _get_data(self) -> t.Any:
         formdata = self._formdata
         if formdata:
-            data = []
+            pks = [item for item in formdata if item]
+            data = self.loader.get_many(pks) if pks else []
 
-            # TODO: Optimize?
-            for item in formdata:
-                model = self.loader.get_one(item) if item else None
+            # Some keys did not resolve to a model, or several keys spelled
+            # differently, like "1" and "01", resolved to the same one. Find
+            # out which with one lookup per key.
+            if len(data) != len(formdata):
+                data = []
 
-                if model:
-                    data.append(model)
-                else:
-                    self._invalid_formdata = True
+                for item in formdata:
+                    model = self.loader.get_one(item) if item else None
+
+                    if model:
+                        data.append(model)
+                    else:
+                        self._invalid_formdata = True
 
             self._set_data(data)
 
@@ -272,11 +278,15 @@ class AjaxSelectMultipleField(AjaxSelectField):
         valuelist: t.Sequence[str],  # type: ignore[override]
     ) -> None:
         self._formdata = set()
+        self._invalid_formdata = False
 
         for field in valuelist:
             for n in field.split(self.separator):
                 self._formdata.add(n)
 
     def pre_validate(self, form: BaseForm) -> None:
+        # Resolve submitted keys, so invalid ones are detected before use
+        self._get_data()
+
         if self._invalid_formdata:
             raise ValidationError(self.gettext("Not a valid choice"))
@@ -173,6 +173,23 @@ class InlineFormAdmin(InlineBaseFormAdmin):
     class can not be inherited from the parent model definition.
     """
 
+    page_size: int | None = None
+    """
+        Number of related models displayed at once. If set, the inline list is
+        paginated and only the displayed models are processed on save.
+        Supported by the SQLAlchemy backend.
+
+        Only `lazy="dynamic"` relationships are paginated by the database,
+        ordered by primary key, and load only the submitted models on save.
+        Other collections are still loaded in full and then sliced,
+        pagination only saves building and rendering their forms.
+
+        For example::
+
+            class MyView(ModelView):
+                inline_models = ((LineItem, {"page_size": 50}),)
+    """
+
     def __init__(
         self, model: t.Union[T_ORM_MODEL, "InlineBaseFormAdmin"], **kwargs: t.Any
     ) -> None:
@@ -1,4 +1,9 @@
+import time
 import typing as t
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import quote
+from urllib.parse import quote_plus
 
 import werkzeug
 
@@ -45,3 +50,85 @@ def get_mdict_item_or_list(
         else:
             return tuple(v)
     return None
+
+
+class UrlTemplate:
+    """
+    URL generated once with a placeholder in place of one of its arguments.
+
+    Calling the template substitutes the placeholder with an actual value,
+    which is a lot cheaper than building the URL with `url_for` again.
+
+    For example::
+
+        url = UrlTemplate(view.get_url('.edit_view', id=UrlTemplate.placeholder))
+        url(42)
+    """
+
+    placeholder = "__flask_admin_placeholder__"
+
+    def __init__(self, url: str) -> None:
+        """
+        Constructor
+
+        :param url:
+            URL containing `placeholder`
+        """
+        self.url = url
+        self.prefix, found, self.suffix = url.partition(self.placeholder)
+        self.has_placeholder = bool(found)
+
+        # Query string arguments are encoded the same way as in `url_for`
+        self._quote = quote_plus if "?" in self.prefix else quote
+
+    def __call__(self, value: t.Any) -> str:
+        if not self.has_placeholder:
+            return self.url
+
+        return self.prefix + self._quote(str(value), safe="!$'()*,/:;?@") + self.suffix
+
+
+class RequestTimer:
+    """
+    Time spent in the named steps of a request.
+
+    Steps that run more than once, like formatting list cells, add up.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """
+        Measure time spent in the `with` block as step `name`.
+
+        :param name:
+            Step name
+        """
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, duration: float) -> None:
+        """
+        Add `duration` seconds to step `name`.
+
+        :param name:
+            Step name
+        :param duration:
+            Duration in seconds
+        """
+        self.timings[name] = self.timings.get(name, 0.0) + duration
+
+    def get_server_timing(self) -> str:
+        """
+        Return timings as a `Server-Timing` header value, in milliseconds.
+        """
+        return ", ".join(
+            f"{name};dur={duration * 1000:.3f}"
+            for name, duration in self.timings.items()
+        )
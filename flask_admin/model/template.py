@@ -71,12 +71,18 @@ class EndpointLinkRowAction(BaseListRowAction):
 
     def render(self, context: Context, row_id: str, row: t.Any) -> t.Any:
         m = self._resolve_symbol(context, "row_actions.link")
-        get_url = self._resolve_symbol(context, "get_url")
 
         kwargs = dict(self.url_args) if self.url_args else {}
-        kwargs[self.id_arg] = row_id
 
-        url = get_url(self.endpoint, **kwargs)
+        # List view provides cached URL builder
+        get_row_url = context.get("get_row_url")
+        if get_row_url is not None:
+            url = get_row_url(self.endpoint, row_id, id_arg=self.id_arg, **kwargs)
+        else:
+            get_url = self._resolve_symbol(context, "get_url")
+
+            kwargs[self.id_arg] = row_id
+            url = get_url(self.endpoint, **kwargs)
 
         return m(self, url)
 
@@ -1,5 +1,7 @@
+import inspect
 import json
 import typing as t
+import warnings
 from enum import Enum
 
 from markupsafe import Markup
@@ -7,6 +9,7 @@ from markupsafe import Markup
 from flask_admin._compat import text_type
 from flask_admin._types import T_COLUMN_TYPE_FORMATTERS
 from flask_admin._types import T_MODEL_VIEW
+from flask_admin._types import T_TYPE_FORMATTER
 
 
 def null_formatter(view: T_MODEL_VIEW, value: t.Any, name: str) -> str:
@@ -98,3 +101,83 @@ DETAIL_FORMATTERS: T_COLUMN_TYPE_FORMATTERS = {
 BASE_FORMATTERS[Enum] = enum_formatter
 EXPORT_FORMATTERS[Enum] = enum_formatter
 DETAIL_FORMATTERS[Enum] = enum_formatter
+
+
+def _get_formatter_call(formatter: T_TYPE_FORMATTER) -> T_TYPE_FORMATTER:
+    """
+    Return callable with the `(view, value, name)` signature for a type
+    formatter, wrapping formatters that do not accept `name`.
+    """
+    try:
+        signature = inspect.signature(formatter)
+    except (TypeError, ValueError):
+        return formatter
+
+    try:
+        signature.bind(None, None, None)
+    except TypeError:
+        try:
+            signature.bind(None, None)
+        except TypeError:
+            return formatter
+    else:
+        return formatter
+
+    warnings.warn(
+        f"Please update your type formatter {formatter} to "
+        "include additional `name` parameter.",
+        stacklevel=1,
+    )
+
+    def call(view: T_MODEL_VIEW, value: t.Any, name: str) -> t.Any:
+        return formatter(view, value)  # type: ignore[call-arg]
+
+    return call
+
+
+class TypeFormatterDispatch:
+    """
+    Finds the type formatter for a value.
+
+    Formatters are checked in their declaration order and the first one
+    matching the value is used, like `isinstance` checks would do. The
+    result is remembered for the type of the value, so every type is
+    resolved only once.
+    """
+
+    def __init__(self, formatters: T_COLUMN_TYPE_FORMATTERS) -> None:
+        """
+        Constructor
+
+        :param formatters:
+            Dictionary of type formatters
+        """
+        self.formatters = formatters
+        self._formatters = [
+            (typeobj, _get_formatter_call(formatter))
+            for typeobj, formatter in formatters.items()
+        ]
+        self._cache: dict[type, T_TYPE_FORMATTER | None] = {}
+
+    def get(self, value: t.Any) -> T_TYPE_FORMATTER | None:
+        """
+        Return formatter for the value or None, if there is no formatter.
+
+        :param value:
+            Value to format
+        """
+        value_type = type(value)
+
+        try:
+            return self._cache[value_type]
+        except KeyError:
+            pass
+
+        result = None
+        for typeobj, formatter in self._formatters:
+            if isinstance(value, typeobj):
+                result = formatter
+                break
+
+        self._cache[value_type] = result
+        return result
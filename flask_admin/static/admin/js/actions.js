@@ -28,24 +28,21 @@ var AdminModelActions = function(actionErrorMessage, actionConfirmations) {
         return false;
     };
 
-    $(function() {
-        $('.action-rowtoggle').change(function() {
-            $('input.action-checkbox').prop('checked', this.checked);
-        });
+    // Delegated, list rows can be replaced after the page was loaded
+    $(document).on('change', '.action-rowtoggle', function() {
+        $('input.action-checkbox').prop('checked', this.checked);
     });
 
-    $(function() {
+    $(document).on('change', 'input.action-checkbox', function() {
         var inputs = $('input.action-checkbox');
-        inputs.change(function() {
-            var allInputsChecked = true;
-            for (var i = 0; i < inputs.length; i++) {
-                if (!inputs[i].checked) {
-                    allInputsChecked = false;
-                    break;
-                }
+        var allInputsChecked = true;
+        for (var i = 0; i < inputs.length; i++) {
+            if (!inputs[i].checked) {
+                allInputsChecked = false;
+                break;
             }
-            $('.action-rowtoggle').attr('checked', allInputsChecked);
-        });
+        }
+        $('.action-rowtoggle').attr('checked', allInputsChecked);
     });
 };
 var modelActions = new AdminModelActions(JSON.parse($('#message-data').text()), JSON.parse($('#actions-confirmation-data').text()));
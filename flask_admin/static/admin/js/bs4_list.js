@@ -0,0 +1,58 @@
+// Replace the list table and pager in place when paging or sorting.
+// Search and filter forms reload the whole page, menu bar links are not
+// updated after a swap.
+(function() {
+    var $container = $('#model-list-fragment');
+
+    if (!$container.length || !window.history.pushState) {
+        return;
+    }
+
+    function getFragmentUrl(url) {
+        var fragmentUrl = new URL(url, window.location.href);
+        fragmentUrl.searchParams.set('fragment', 'list');
+        return fragmentUrl.toString();
+    }
+
+    function load(url, push) {
+        $.get(getFragmentUrl(url)).done(function(html) {
+            $container.html(html);
+            faForm.applyGlobalStyles($container);
+
+            // Actions redirect back to the displayed page
+            $('#action_form input[name=url]').val(
+                window.location.pathname + window.location.search
+            );
+
+            $(document).trigger('adminListFragmentLoaded', [$container]);
+        }).fail(function() {
+            window.location.href = url;
+        });
+
+        if (push) {
+            window.history.pushState({listFragment: true}, '', url);
+        }
+    }
+
+    $container.on('click', '.pagination a.page-link, th.column-header a[href]', function(e) {
+        var href = $(this).attr('href');
+
+        if (!href || href.indexOf('javascript:') === 0 ||
+            e.ctrlKey || e.metaKey || e.shiftKey || e.which > 1) {
+            return;
+        }
+
+        e.preventDefault();
+        load(this.href, true);
+    });
+
+    window.history.replaceState({listFragment: true}, '');
+
+    $(window).on('popstate', function(e) {
+        var state = e.originalEvent.state;
+
+        if (state && state.listFragment) {
+            load(window.location.href, false);
+        }
+    });
+})();
@@ -8,6 +8,8 @@
       */
       function processAjaxWidget($el, name) {
         var multiple = $el.attr('data-multiple') == '1';
+        // Primary key of the last loaded item, used to continue paging
+        var lastId = null;
 
         var opts = {
           width: 'resolve',
@@ -17,11 +19,17 @@
           ajax: {
             url: $el.attr('data-url'),
             data: function(term, page) {
-              return {
+              var params = {
                 query: term,
                 offset: (page - 1) * 10,
                 limit: 10
               };
+
+              if (page > 1 && lastId !== null) {
+                params.after = lastId;
+              }
+
+              return params;
             },
             results: function(data, page) {
               var results = [];
@@ -32,6 +40,10 @@
                 results.push({id: v[0], text: v[1]});
               }
 
+              if (results.length) {
+                lastId = results[results.length - 1].id;
+              }
+
               return {
                 results: results,
                 more: results.length == 10
@@ -264,3 +264,19 @@ class TestLocalFileAdmin(Base.FileAdminTests):
             os.remove(op.join(self._test_files_root, "dummy2.txt"))
         except OSError:
             pass
+
+    def test_fileadmin_download_conditional(self, app, admin):
+        # Without base_url files are sent by the view itself
+        view = fileadmin.FileAdmin(self._test_files_root, name="Files")
+        admin.add_view(view)
+
+        client = app.test_client()
+
+        with client.get("/admin/fileadmin/download/dummy.txt") as rv:
+            assert rv.status_code == 200
+            etag = rv.headers["ETag"]
+
+        with client.get(
+            "/admin/fileadmin/download/dummy.txt", headers={"If-None-Match": etag}
+        ) as rv:
+            assert rv.status_code == 304
@@ -1009,6 +1009,9 @@ def test_ajax_fk(app, db, admin):
     assert len(items) == 1
     assert items[0].test1 == "foo"  # type: ignore[union-attr]
 
+    items = loader.get_many([model.id, model2.id, 1000])  # type: ignore[attr-defined]
+    assert sorted(item.id for item in items) == [model.id, model2.id]  # type: ignore[attr-defined]
+
     # Check form generation
     form = view.create_form()
     assert form.model1.__class__.__name__ == "AjaxSelectField"  # type: ignore[attr-defined]
@@ -1029,6 +1032,9 @@ def test_ajax_fk(app, db, admin):
     req = client.get("/admin/view/ajax/lookup/?name=model1&query=foo")
     assert req.data == b'[[%d, "foo"]]' % model2.id  # type: ignore[attr-defined]
 
+    req = client.get(f"/admin/view/ajax/lookup/?name=model1&query=&after={model.id}")  # type: ignore[attr-defined]
+    assert req.data == b'[[%d, "foo"]]' % model2.id  # type: ignore[attr-defined]
+
     # Check submitting
     client.post("/admin/view/new/", data={"model1": as_unicode(model.id)})  # type: ignore[attr-defined]
     mdl = Model2.select().first()
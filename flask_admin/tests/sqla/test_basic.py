@@ -16,6 +16,7 @@ from sqlalchemy import Column
 from sqlalchemy import Date
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
+from sqlalchemy import event
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
@@ -26,6 +27,7 @@ from sqlalchemy import Time
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
 from sqlalchemy_utils import ArrowType
 from sqlalchemy_utils import ChoiceType
 from sqlalchemy_utils import ColorType
@@ -48,6 +50,7 @@ from flask_admin.contrib.sqla import ModelView
 from flask_admin.contrib.sqla import tools
 from flask_admin.form.fields import DateTimeField
 from flask_admin.form.fields import Select2Field
+from flask_admin.model.base import clear_scaffold_cache
 from flask_admin.tests import flask_babel_test_decorator
 from flask_admin.tests.conftest import skip_or_return_session_or_db
 
@@ -829,6 +832,160 @@ def test_details_view(app, sqla_db_ext, admin, session_or_db):
         assert "test1_val_1" not in data
 
 
+def test_column_editable_list_cells(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1, param, column_editable_list=["test1", "bool_field"]
+        )
+        admin.add_view(view)
+
+        fill_db(sqla_db_ext, Model1, Model2)
+
+        client = app.test_client()
+
+        # Cells share one form, but show the data of their row
+        rv = client.get("/admin/model1/")
+        data = rv.data.decode("utf-8")
+        assert re.search(r'data-pk="1"[^>]*data-value="1"[^>]*name="bool_field"', data)
+        assert re.search(r'data-pk="2"[^>]*data-value=""[^>]*name="bool_field"', data)
+        assert re.search(
+            r'data-pk="2"[^>]*data-value="test1_val_2"[^>]*name="test1"', data
+        )
+
+        # Updates use a form class with the submitted field only
+        rv = client.post(
+            "/admin/model1/ajax/update/",
+            data={"list_form_pk": "2", "bool_field": "1"},
+        )
+        assert rv.data.decode("utf-8") == "Record was successfully saved."
+
+        form_class = view._list_form_field_classes["bool_field"]
+        assert sorted(f.name for f in form_class()) == ["bool_field", "list_form_pk"]
+        assert view._get_list_form_field_class("bool_field") is form_class
+        assert view._get_list_form_field_class("test2") is None
+
+        rv = client.get("/admin/model1/")
+        data = rv.data.decode("utf-8")
+        assert re.search(r'data-pk="2"[^>]*data-value="1"[^>]*name="bool_field"', data)
+
+
+def test_column_editable_list_custom_list_form(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        class RowModelView(CustomModelView):
+            def list_form(self, obj=None):
+                form = super().list_form(obj=obj)
+                if obj is not None:
+                    form.bool_field.data = obj.id % 2 == 0
+                return form
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = RowModelView(Model1, param, column_editable_list=["bool_field"])
+        admin.add_view(view)
+
+        fill_db(sqla_db_ext, Model1, Model2)
+
+        client = app.test_client()
+
+        # Every row gets its own form from the custom `list_form`
+        rv = client.get("/admin/model1/")
+        data = rv.data.decode("utf-8")
+        assert re.search(r'data-pk="1"[^>]*data-value=""[^>]*name="bool_field"', data)
+        assert re.search(r'data-pk="2"[^>]*data-value="1"[^>]*name="bool_field"', data)
+
+
+def test_column_editable_list_batch(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1, param, column_editable_list=["test1", "enum_field"]
+        )
+        admin.add_view(view)
+
+        class ListFormView(CustomModelView):
+            def list_form(self, obj=None):
+                form = super().list_form(obj)
+                form.test1.validators = [validators.Regexp("^batch")]
+                return form
+
+        view2 = ListFormView(
+            Model1,
+            param,
+            endpoint="list_form",
+            column_editable_list=["test1", "enum_field"],
+        )
+        admin.add_view(view2)
+
+        fill_db(sqla_db_ext, Model1, Model2)
+
+        commits = []
+
+        def on_commit(session):
+            commits.append(session)
+
+        event.listen(Session, "after_commit", on_commit)
+
+        client = app.test_client()
+        rv = client.post(
+            "/admin/model1/ajax/update/batch/",
+            json={
+                "edits": [
+                    {"pk": 1, "field": "test1", "value": "batch-1"},
+                    {"pk": "2", "field": "test1", "value": "batch-2"},
+                    {"pk": 3, "field": "enum_field", "value": "problematic-input"},
+                    {"pk": 4, "field": "test2", "value": "problematic-input"},
+                    {"pk": 1000, "field": "test1", "value": "problematic-input"},
+                ]
+            },
+        )
+        event.remove(Session, "after_commit", on_commit)
+        assert rv.status_code == 200
+
+        results = rv.json["results"]
+        assert [r["success"] for r in results] == [True, True, False, False, False]
+        assert results[0]["message"] == "Record was successfully saved."
+        assert results[4]["message"] == "Record does not exist."
+        assert len(commits) == 1
+
+        rv = client.get("/admin/model1/")
+        data = rv.data.decode("utf-8")
+        assert "batch-1" in data
+        assert "batch-2" in data
+        assert "problematic-input" not in data
+
+        rv = client.post("/admin/model1/ajax/update/batch/", json={"edits": 1})
+        assert rv.status_code == 400
+
+        # Only columns of `column_editable_list` can be edited
+        rv = client.post(
+            "/admin/model1/ajax/update/batch/",
+            json={"edits": [{"pk": 1, "field": "list_form_pk", "value": "2"}]},
+        )
+        assert rv.json["results"][0]["success"] is False
+
+        # Custom `list_form` implementations are used
+        rv = client.post(
+            "/admin/list_form/ajax/update/batch/",
+            json={
+                "edits": [
+                    {"pk": 1, "field": "test1", "value": "batch-3"},
+                    {"pk": 2, "field": "test1", "value": "problematic-input"},
+                ]
+            },
+        )
+        results = rv.json["results"]
+        assert [r["success"] for r in results] == [True, False]
+        assert "problematic-input" not in client.get("/admin/model1/").data.decode(
+            "utf-8"
+        )
+
+
 def test_editable_list_special_pks(app, sqla_db_ext, admin, session_or_db):
     """Tests editable list view + a primary key with special characters"""
     with app.app_context():
@@ -2697,6 +2854,21 @@ def test_ajax_fk(app, sqla_db_ext, admin, session_or_db):
         req = client.get("/admin/view/ajax/lookup/?name=model1&query=foo")
         assert req.data.decode("utf-8") == f'[[{model2.id}, "foo"]]'
 
+        # Check keyset continuation
+        assert loader.supports_keyset
+        req = client.get("/admin/view/ajax/lookup/?name=model1&query=&limit=1")
+        assert req.data.decode("utf-8") == f'[[{model.id}, "first"]]'
+
+        req = client.get(
+            f"/admin/view/ajax/lookup/?name=model1&query=&limit=1&after={model.id}"
+        )
+        assert req.data.decode("utf-8") == f'[[{model2.id}, "foo"]]'
+
+        req = client.get(
+            f"/admin/view/ajax/lookup/?name=model1&query=&after={model2.id}"
+        )
+        assert req.data.decode("utf-8") == "[]"
+
         # Check submitting
         req = client.post("/admin/view/new/", data={"model1": as_unicode(model.id)})
         mdl = sqla_db_ext.db.session.query(Model2).first()
@@ -2707,6 +2879,41 @@ def test_ajax_fk(app, sqla_db_ext, admin, session_or_db):
         assert mdl.model1.test1 == "first"
 
 
+def test_ajax_fk_offset_loader(app, sqla_db_ext, admin, session_or_db):
+    from flask_admin.contrib.sqla.ajax import QueryAjaxModelLoader
+
+    class OffsetLoader(QueryAjaxModelLoader):
+        def get_list(self, term, offset=0, limit=10):  # type: ignore[override]
+            return super().get_list(term, offset, limit)
+
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        loader = OffsetLoader("model1", param, Model1, fields=["test1"])
+        assert not loader.can_use_keyset()
+
+        view = CustomModelView(
+            Model2, param, url="view", form_ajax_refs={"model1": loader}
+        )
+        admin.add_view(view)
+
+        model = Model1("first")
+        model2 = Model1("foo", "bar")
+        sqla_db_ext.db.session.add_all([model, model2])
+        sqla_db_ext.db.session.commit()
+
+        client = app.test_client()
+
+        # `after` is ignored, the loader is paginated by offset
+        req = client.get(
+            "/admin/view/ajax/lookup/?name=model1&query=&offset=1&limit=1"
+            f"&after={model.id}"
+        )
+        assert req.status_code == 200
+        assert req.data.decode("utf-8") == f'[[{model2.id}, "foo"]]'
+
+
 def test_ajax_fk_multi(app, sqla_db_ext, admin, session_or_db):
     with app.app_context():
 
@@ -2749,9 +2956,16 @@ def test_ajax_fk_multi(app, sqla_db_ext, admin, session_or_db):
         assert "model1" in view._form_ajax_refs
 
         model = Model1(name="first")
-        sqla_db_ext.db.session.add_all([model, Model1(name="foo")])
+        model2 = Model1(name="foo")
+        sqla_db_ext.db.session.add_all([model, model2])
         sqla_db_ext.db.session.commit()
 
+        # Check batched loading
+        loader = view._form_ajax_refs["model1"]
+        items = loader.get_many([model.id, model2.id, 1000])
+        assert sorted(item.id for item in items) == [model.id, model2.id]
+        assert loader.get_many([]) == []
+
         # Check form generation
         form = view.create_form()
         assert form.model1.__class__.__name__ == "AjaxSelectMultipleField"  # type: ignore[attr-defined]
@@ -2767,12 +2981,26 @@ def test_ajax_fk_multi(app, sqla_db_ext, admin, session_or_db):
 
         # Check submitting
         client = app.test_client()
-        client.post("/admin/view/new/", data={"model1": as_unicode(model.id)})
+        rv = client.post("/admin/view/new/", data={"model1": f"{model.id},1000"})
+        assert rv.status_code == 200
+        assert sqla_db_ext.db.session.query(Model2).count() == 0
+
+        client.post("/admin/view/new/", data={"model1": f"{model.id},{model2.id}"})
         mdl = sqla_db_ext.db.session.query(Model2).first()
 
         assert mdl is not None
         assert mdl.model1 is not None
-        assert len(mdl.model1) == 1
+        assert len(mdl.model1) == 2
+
+        # Different spellings of the same key are accepted
+        with app.test_request_context(
+            "/admin/view/new/",
+            method="POST",
+            data={"model1": f"{model.id},0{model.id}"},
+        ):
+            form = view.create_form()
+            assert form.validate()
+            assert form.model1.data == [model, model]
 
 
 def test_safe_redirect(app, sqla_db_ext, admin, session_or_db):
@@ -2889,7 +3117,7 @@ def test_customising_page_size(app, sqla_db_ext, admin, session_or_db):
         M1, _ = create_models(sqla_db_ext)
 
         sqla_db_ext.db.session.add_all(
-            [M1(str(f"instance-{x+1:03d}")) for x in range(101)]
+            [M1(str(f"instance-{x + 1:03d}")) for x in range(101)]
         )
 
         param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
@@ -3437,3 +3665,399 @@ def test_sqlalite_session_raises(app, sqla_db_ext):
         sqla_db_ext.create_all()
 
     ModelView(Model, sqla_db_ext.db.session)
+
+
+def test_get_one_select_related(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(Model2, param, can_view_details=True)
+        admin.add_view(view)
+
+        # Relation used by the edit form is eager loaded
+        assert view._get_get_one_relations("edit") == ["model1"]
+        assert len(view._get_one_options["edit"]) == 1
+
+        view1 = CustomModelView(
+            Model1,
+            param,
+            endpoint="model1_all",
+            form_columns=["test1"],
+            column_details_list=["test1", "model2"],
+            can_view_details=True,
+        )
+        admin.add_view(view1)
+        assert view1._get_get_one_relations("details") == ["model2"]
+        assert view1._get_get_one_relations("edit") == []
+
+        # The details view does not load the relations of the edit form
+        view5 = CustomModelView(
+            Model1,
+            param,
+            endpoint="model1_details",
+            column_details_list=["test1"],
+            inline_models=[Model2],
+            can_view_details=True,
+        )
+        admin.add_view(view5)
+        assert view5._get_get_one_relations("details") == []
+        assert view5._get_get_one_relations("edit") == ["model2"]
+
+        # Read-only views have no edit plan
+        view5.can_edit = False
+        view5._refresh_cache()
+        assert view5._get_get_one_relations("edit") == []
+        assert view5._get_one_options["edit"] == []
+
+        # Paginated inline lists load only their displayed page
+        view4 = CustomModelView(
+            Model1,
+            param,
+            endpoint="model1_inline",
+            form_columns=["test1"],
+            inline_models=[(Model2, {"page_size": 2})],
+        )
+        admin.add_view(view4)
+        assert view4._get_get_one_relations("edit") == []
+
+        view4.inline_models = [Model2]
+        view4._refresh_cache()
+        assert view4._get_get_one_relations("edit") == ["model2"]
+
+        view2 = CustomModelView(
+            Model2,
+            param,
+            endpoint="model2_none",
+            get_one_auto_select_related=False,
+        )
+        admin.add_view(view2)
+        assert view2._get_one_options == {"details": [], "edit": []}
+
+        view3 = CustomModelView(
+            Model2,
+            param,
+            endpoint="model2_custom",
+            get_one_select_related_list=["model1"],
+        )
+        admin.add_view(view3)
+        assert len(view3._get_one_options["details"]) == 1
+        assert len(view3._get_one_options["edit"]) == 1
+
+        model1 = Model1("first")
+        sqla_db_ext.db.session.add(Model2("second", model1=model1))
+        sqla_db_ext.db.session.commit()
+        sqla_db_ext.db.session.expunge_all()
+
+        # Only the edit and details views eager load relations
+        obj = view.get_one("1")
+        assert "model1" not in obj.__dict__
+        sqla_db_ext.db.session.expunge_all()
+
+        obj = view.get_one_for_display("1", "edit")
+        assert "model1" in obj.__dict__
+        assert obj.model1.test1 == "first"
+
+        client = app.test_client()
+        rv = client.get("/admin/model2/details/?id=1")
+        assert rv.status_code == 200
+
+
+def test_column_version(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view1 = CustomModelView(
+            Model1,
+            param,
+            column_version="datetime_field",
+            column_searchable_list=["test1"],
+            can_view_details=True,
+        )
+        view2 = CustomModelView(
+            Model2, param, column_version="int_field", can_view_details=True
+        )
+        admin.add_view(view1)
+        admin.add_view(view2)
+
+        model1 = Model1("first", datetime_field=datetime(2024, 1, 1, 12, 0))
+        model2 = Model2("second", int_field=1)
+        sqla_db_ext.db.session.add_all([model1, model2, Model1("other")])
+        sqla_db_ext.db.session.commit()
+
+        assert view2.get_one_version("1") == 1
+        assert view2.get_one_version("42") is None
+        assert view1.get_list_version(None, None) == (2, datetime(2024, 1, 1, 12, 0))
+        assert view1.get_list_version("other", None) == (1, None)
+
+        client = app.test_client()
+
+        # Details view
+        rv = client.get("/admin/model2/details/?id=1")
+        assert rv.status_code == 200
+        etag = rv.headers["ETag"]
+        assert "Last-Modified" not in rv.headers
+        assert "no-cache" in rv.headers["Cache-Control"]
+
+        rv = client.get("/admin/model2/details/?id=1", headers={"If-None-Match": etag})
+        assert rv.status_code == 304
+        assert rv.data == b""
+
+        model2.int_field = 2
+        sqla_db_ext.db.session.commit()
+
+        rv = client.get("/admin/model2/details/?id=1", headers={"If-None-Match": etag})
+        assert rv.status_code == 200
+        assert rv.headers["ETag"] != etag
+
+        # List view
+        rv = client.get("/admin/model1/")
+        assert rv.status_code == 200
+        etag = rv.headers["ETag"]
+        last_modified = rv.headers["Last-Modified"]
+
+        rv = client.get("/admin/model1/", headers={"If-None-Match": etag})
+        assert rv.status_code == 304
+
+        rv = client.get("/admin/model1/", headers={"If-Modified-Since": last_modified})
+        assert rv.status_code == 304
+
+        rv = client.get("/admin/model1/?search=other", headers={"If-None-Match": etag})
+        assert rv.status_code == 200
+
+        sqla_db_ext.db.session.delete(model1)
+        sqla_db_ext.db.session.commit()
+
+        rv = client.get("/admin/model1/", headers={"If-None-Match": etag})
+        assert rv.status_code == 200
+        assert rv.headers["ETag"] != etag
+        etag = rv.headers["ETag"]
+
+        # Pages are not reused by another session or with pending messages
+        with client.session_transaction() as sess:
+            sess["_flashes"] = [("message", "Saved.")]
+
+        rv = client.get("/admin/model1/", headers={"If-None-Match": etag})
+        assert rv.status_code == 200
+        assert rv.headers["ETag"] == etag
+
+        with client.session_transaction() as sess:
+            sess["csrf"] = "other session"
+
+        rv = client.get("/admin/model1/", headers={"If-None-Match": etag})
+        assert rv.status_code == 200
+        assert rv.headers["ETag"] != etag
+
+
+def test_canonical_list_urls(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, _ = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model1,
+            param,
+            column_filters=["test1"],
+            column_searchable_list=["test1"],
+            list_canonical_redirect=True,
+            can_create=False,
+            can_edit=False,
+            can_delete=False,
+            cache_control={"public": True, "max_age": 60},
+            cache_vary=("Accept-Language",),
+        )
+        admin.add_view(view)
+
+        client = app.test_client()
+
+        rv = client.get("/admin/model1/?search=&page_size=20&flt5_0=b&flt1_0=a&foo=1")
+        assert rv.status_code == 302
+        assert rv.location == "/admin/model1/?flt0_0=a&flt1_0=b&foo=1"
+
+        rv = client.get(rv.location)
+        assert rv.status_code == 200
+        cache_control = set(rv.headers["Cache-Control"].split(", "))
+        assert cache_control == {"public", "max-age=60"}
+        assert "Accept-Language" in rv.headers["Vary"]
+
+
+def test_list_api(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        _, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model2,
+            param,
+            column_list=["string_field", "int_field", "bool_field"],
+            column_labels={"string_field": "Name"},
+            column_searchable_list=["string_field"],
+            column_default_sort="id",
+            page_size=2,
+        )
+        admin.add_view(view)
+
+        sqla_db_ext.db.session.add_all(
+            [
+                Model2("first", int_field=1, bool_field=True),
+                Model2("second", int_field=2),
+                Model2("third", int_field=3, bool_field=False),
+            ]
+        )
+        sqla_db_ext.db.session.commit()
+
+        client = app.test_client()
+
+        rv = client.get("/admin/model2/api/list/")
+        assert rv.status_code == 404
+
+        view.can_list_api = True
+
+        rv = client.get("/admin/model2/api/list/")
+        assert rv.status_code == 200
+        assert rv.json == {
+            "columns": ["string_field", "int_field", "bool_field"],
+            "labels": ["Name", "Int Field", "Bool Field"],
+            "rows": [["1", "first", 1, True], ["2", "second", 2, ""]],
+            "count": 3,
+            "cursor": "1",
+        }
+
+        rv = client.get("/admin/model2/api/list/?cursor=1")
+        assert rv.json["rows"] == [["3", "third", 3, False]]
+        assert rv.json["cursor"] is None
+
+        rv = client.get("/admin/model2/api/list/?search=second")
+        assert rv.json["rows"] == [["2", "second", 2, ""]]
+        assert rv.json["count"] == 1
+        assert rv.json["cursor"] is None
+
+        rv = client.get("/admin/model2/api/list/?cursor=next")
+        assert rv.status_code == 400
+
+
+def test_share_scaffolding(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, _ = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        clear_scaffold_cache()
+
+        def create_view(endpoint, **kwargs):
+            return CustomModelView(
+                Model1,
+                param,
+                endpoint=endpoint,
+                share_scaffolding=True,
+                column_editable_list=["test1"],
+                **kwargs,
+            )
+
+        try:
+            view1 = create_view("view1")
+            view2 = create_view("view2")
+            view3 = create_view("view3", column_list=["test1", "test2"])
+            view4 = CustomModelView(Model1, param, endpoint="view4")
+        finally:
+            clear_scaffold_cache()
+
+        assert view1._create_form_class is view2._create_form_class
+        assert view1._edit_form_class is view2._edit_form_class
+        assert view1._list_form_class is view2._list_form_class
+        assert view1._list_columns is view2._list_columns
+
+        assert view1._create_form_class is not view3._create_form_class
+        assert view1._list_columns is not view3._list_columns
+        assert [c for c, _ in view3._list_columns] == ["test1", "test2"]
+
+        assert view1._create_form_class is not view4._create_form_class
+
+        admin.add_view(view1)
+        admin.add_view(view2)
+
+        client = app.test_client()
+        for url in ("/admin/view1/new/", "/admin/view2/new/"):
+            rv = client.post(url, data=dict(test1="test1large", test2="test2"))
+            assert rv.status_code == 302
+
+        assert sqla_db_ext.db.session.query(Model1).count() == 2
+
+
+def test_server_timing(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        _, Model2 = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(
+            Model2,
+            param,
+            column_searchable_list=["string_field"],
+            can_export=True,
+        )
+        admin.add_view(view)
+
+        sqla_db_ext.db.session.add_all([Model2("first"), Model2("second")])
+        sqla_db_ext.db.session.commit()
+
+        client = app.test_client()
+
+        rv = client.get("/admin/model2/")
+        assert "Server-Timing" not in rv.headers
+
+        view.server_timing = True
+        rv = client.get("/admin/model2/?search=first")
+        assert rv.status_code == 200
+        steps = [
+            metric.split(";")[0] for metric in rv.headers["Server-Timing"].split(", ")
+        ]
+        assert set(steps) == {
+            "view",
+            "search",
+            "count",
+            "query",
+            "render",
+            "formatters",
+        }
+
+        metrics = []
+        view.server_timing = False
+        view.metrics_hook = lambda *args: metrics.append(args)
+
+        rv = client.get("/admin/model2/export/csv/")
+        assert rv.status_code == 200
+        assert "Server-Timing" not in rv.headers
+
+        assert b"second" in rv.data
+        rv.close()
+        assert {name for name, _, _ in metrics} == {
+            "view",
+            "count",
+            "query",
+            "export",
+            "export_rows",
+        }
+        for _, value, labels in metrics:
+            assert value >= 0
+            assert labels == {"view": "model2", "endpoint": "model2.export"}
+
+        # Simple pager views do not run the count query
+        metrics.clear()
+        view.simple_list_pager = True
+        client.get("/admin/model2/")
+        assert "count" not in {name for name, _, _ in metrics}
+        assert "query" in {name for name, _, _ in metrics}
+
+
+def test_empty_column_type_formatters(app, sqla_db_ext, admin, session_or_db):
+    from flask_admin.contrib.sqla.typefmt import DEFAULT_FORMATTERS
+
+    with app.app_context():
+        Model1, _ = create_models(sqla_db_ext)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = CustomModelView(Model1, param, column_type_formatters=dict())
+        admin.add_view(view)
+
+        assert view.column_type_formatters == {}
+        assert DEFAULT_FORMATTERS[arrow.Arrow] is not None
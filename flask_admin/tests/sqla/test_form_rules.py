@@ -346,3 +346,53 @@ def test_inline_model_rules(app, sqla_db_ext, admin, session_or_db):
 
         data = rv.data.decode("utf-8")
         assert "int_field" not in data
+
+
+@pytest.mark.filterwarnings("ignore:Fields missing:UserWarning")
+def test_form_rules_compiled(app, sqla_db_ext, admin, session_or_db):
+    with app.app_context():
+        Model1, _ = create_models(sqla_db_ext)
+        sqla_db_ext.create_all()
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        form_rules = (
+            rules.FieldSet(["test2", rules.Text("<b>nested</b>")], "header"),
+            rules.Text("<b>escaped</b>"),
+            rules.HTML("<h1>html</h1>"),
+            rules.Macro("test", arg="foobar"),
+            rules.Container("wrap", rules.Macro("test_lib.another_test")),
+            rules.Row(rules.Field("test1"), rules.Field("test4")),
+        )
+
+        views = {}
+        for compiled in (False, True):
+            endpoint = f"compiled{int(compiled)}"
+            views[compiled] = CustomModelView(
+                Model1,
+                param,
+                endpoint=endpoint,
+                create_template="macro.html",
+                form_create_rules=form_rules,
+                form_rules_compiled=compiled,
+            )
+            admin.add_view(views[compiled])
+
+        walked_rules = views[False]._form_create_rules
+        compiled_rules = views[True]._form_create_rules
+        assert walked_rules is not None and walked_rules.compiled_source is None
+        assert compiled_rules is not None and compiled_rules.compiled_source
+
+        client = app.test_client()
+        walked = client.get("/admin/compiled0/new/").data.decode("utf-8")
+        compiled = client.get("/admin/compiled1/new/").data.decode("utf-8")
+
+        assert "&lt;b&gt;escaped&lt;/b&gt;" in compiled
+        assert "<b>nested</b>" in compiled
+        assert "Value = foobar" in compiled
+
+        # Same markup, without the whitespace of the rules loop
+        def form_html(data, endpoint):
+            data = data[data.index("<form") : data.index("</form>")]
+            return "".join(data.replace(endpoint, "view").split())
+
+        assert form_html(compiled, "compiled1") == form_html(walked, "compiled0")
@@ -1,5 +1,6 @@
 from sqlalchemy import Column
 from sqlalchemy import DateTime
+from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import Integer
@@ -324,3 +325,232 @@ def test_inline_form_base_class(app, sqla_db_ext, admin, session_or_db):
         assert rv.status_code == 200
         assert sqla_db_ext.db.session.query(func.count(User.id)).scalar() == 0
         assert b"success!" in rv.data, rv.data
+
+
+def test_inline_form_page_size(app, sqla_db_ext, admin, session_or_db):
+    client = app.test_client()
+
+    with app.app_context():
+        # Set up models and database
+        class User(sqla_db_ext.Base):  # type: ignore[name-defined, misc]
+            __tablename__ = "users"
+            id = Column(Integer, primary_key=True)
+            name = Column(String, unique=True)
+
+        class UserInfo(sqla_db_ext.Base):  # type: ignore[name-defined, misc]
+            __tablename__ = "user_info"
+            id = Column(Integer, primary_key=True)
+            key = Column(String, nullable=False)
+            val = Column(String)
+            user_id = Column(Integer, ForeignKey(User.id))
+            user = relationship(
+                User,
+                backref=backref(
+                    "info", cascade="all, delete-orphan", single_parent=True
+                ),
+            )
+
+        sqla_db_ext.create_all()
+
+        class UserModelView(ModelView):
+            inline_models = ((UserInfo, {"page_size": 2}),)  # type: ignore[assignment]
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = UserModelView(User, param)
+        admin.add_view(view)
+
+        user = User(name="foo")
+        user.info = [UserInfo(key=f"key{i}", val=f"val{i}") for i in range(5)]
+        sqla_db_ext.db.session.add(user)
+        sqla_db_ext.db.session.commit()
+
+        # Only the first page of related models is displayed
+        rv = client.get(f"/admin/user/edit/?id={user.id}")
+        assert rv.status_code == 200
+        data = rv.data.decode("utf-8")
+        assert 'value="key0"' in data
+        assert 'value="key1"' in data
+        assert 'value="key2"' not in data
+        assert "info-page=2" in data
+
+        rv = client.get(f"/admin/user/edit/?id={user.id}&info-page=2")
+        assert rv.status_code == 200
+        data = rv.data.decode("utf-8")
+        assert 'value="key4"' in data
+        assert 'value="key0"' not in data
+
+        # Saving a page keeps related models displayed on other pages
+        info = user.info[4]
+        rv = client.post(
+            f"/admin/user/edit/?id={user.id}&info-page=2",
+            data={
+                "name": "foo",
+                "info-0-id": str(info.id),
+                "info-0-key": "key4",
+                "info-0-val": "changed",
+            },
+        )
+        assert rv.status_code == 302
+
+        infos = sqla_db_ext.db.session.query(UserInfo).order_by(UserInfo.id).all()
+        assert len(infos) == 5
+        assert [i.val for i in infos] == ["val0", "val1", "val2", "val3", "changed"]
+
+
+def test_inline_form_page_size_dynamic(app, sqla_db_ext, admin, session_or_db):
+    client = app.test_client()
+
+    with app.app_context():
+        # Set up models and database
+        class User(sqla_db_ext.Base):  # type: ignore[name-defined, misc]
+            __tablename__ = "users"
+            id = Column(Integer, primary_key=True)
+            name = Column(String, unique=True)
+
+        class UserInfo(sqla_db_ext.Base):  # type: ignore[name-defined, misc]
+            __tablename__ = "user_info"
+            id = Column(Integer, primary_key=True)
+            key = Column(String, nullable=False)
+            val = Column(String)
+            user_id = Column(Integer, ForeignKey(User.id))
+            user = relationship(
+                User,
+                backref=backref(
+                    "info",
+                    cascade="all, delete-orphan",
+                    single_parent=True,
+                    lazy="dynamic",
+                ),
+            )
+
+        sqla_db_ext.create_all()
+
+        class UserModelView(ModelView):
+            inline_models = ((UserInfo, {"page_size": 1}),)  # type: ignore[assignment]
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = UserModelView(User, param)
+        admin.add_view(view)
+
+        user = User(name="foo")
+        sqla_db_ext.db.session.add(user)
+        for i in range(20):
+            sqla_db_ext.db.session.add(UserInfo(key=f"key{i}", user=user))
+        sqla_db_ext.db.session.commit()
+
+        # Pages are ordered by primary key, the pager only links nearby pages
+        rv = client.get(f"/admin/user/edit/?id={user.id}&info-page=10")
+        assert rv.status_code == 200
+        data = rv.data.decode("utf-8")
+        assert 'value="key10"' in data
+        assert 'value="key9"' not in data
+        assert "info-page=7" in data
+        assert "info-page=13" in data
+        assert "info-page=3" not in data
+        assert "info-page=17" not in data
+        assert "info-page=19" in data
+
+        # Saving a page loads only the submitted children
+        session = sqla_db_ext.db.session
+        info = session.query(UserInfo).filter_by(key="key10").one()
+        loaded = []
+
+        def on_load(target, context):
+            loaded.append(target.key)
+
+        event.listen(UserInfo, "load", on_load)
+        session.expunge_all()
+        rv = client.post(
+            f"/admin/user/edit/?id={user.id}&info-page=10",
+            data={
+                "name": "foo",
+                "info-0-id": str(info.id),
+                "info-0-key": "changed",
+                "info-1-key": "new",
+            },
+        )
+        event.remove(UserInfo, "load", on_load)
+        assert rv.status_code == 302
+        assert loaded == ["key10"]
+
+        keys = [i.key for i in session.query(UserInfo).order_by(UserInfo.id)]
+        assert len(keys) == 21
+        assert keys[10] == "changed"
+        assert keys[-1] == "new"
+
+
+def test_inline_form_unique(app, sqla_db_ext, admin, session_or_db):
+    client = app.test_client()
+
+    with app.app_context():
+        # Set up models and database
+        class User(sqla_db_ext.Base):  # type: ignore[name-defined, misc]
+            __tablename__ = "users"
+            id = Column(Integer, primary_key=True)
+            name = Column(String, unique=True)
+
+        class UserEmail(sqla_db_ext.Base):  # type: ignore[name-defined, misc]
+            __tablename__ = "user_info"
+            id = Column(Integer, primary_key=True)
+            email = Column(String, nullable=False, unique=True)
+            user_id = Column(Integer, ForeignKey(User.id))
+            user = relationship(
+                User,
+                backref=backref(
+                    "emails", cascade="all, delete-orphan", single_parent=True
+                ),
+            )
+
+        sqla_db_ext.create_all()
+
+        class UserModelView(ModelView):
+            inline_models = (UserEmail,)
+
+        param = skip_or_return_session_or_db(sqla_db_ext, session_or_db)
+        view = UserModelView(User, param)
+        admin.add_view(view)
+
+        user = User(name="foo")
+        user.emails = [UserEmail(email="a@example.com")]
+        sqla_db_ext.db.session.add(user)
+        sqla_db_ext.db.session.commit()
+
+        queries = []
+
+        def count_queries(conn, cursor, statement, *args):
+            if statement.startswith("SELECT"):
+                queries.append(statement)
+
+        data = {
+            "emails-0-email": "b@example.com",
+            "emails-1-email": "a@example.com",
+            "emails-2-email": "c@example.com",
+        }
+        with app.test_request_context(method="POST", data=data):
+            form = view.create_form()
+            emails = form.emails.entries
+
+            engine = sqla_db_ext.db.engine
+            event.listen(engine, "before_cursor_execute", count_queries)
+            try:
+                assert not form.emails.validate(form)
+            finally:
+                event.remove(engine, "before_cursor_execute", count_queries)
+
+        assert len(queries) == 1
+        assert not emails[0].form.email.errors
+        assert emails[1].form.email.errors == ["Already exists."]
+        assert not emails[2].form.email.errors
+
+        # Existing records do not conflict with themselves
+        rv = client.post(
+            f"/admin/user/edit/?id={user.id}",
+            data={
+                "name": "foo",
+                "emails-0-id": str(user.emails[0].id),
+                "emails-0-email": "a@example.com",
+                "emails-1-email": "b@example.com",
+            },
+        )
+        assert rv.status_code == 302
+        assert sqla_db_ext.db.session.query(func.count(UserEmail.id)).scalar() == 2
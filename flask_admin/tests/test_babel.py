@@ -32,3 +32,40 @@ def test_translations_path(
     if dirname:
         calls = [mock.call.load(dirname, ["qux"], "admin")] + calls
     assert _Translations.method_calls == calls
+
+
+@flask_babel_test_decorator
+def test_translations_cached_per_locale_and_path(request, app, tmp_path):
+    from flask_babel import force_locale
+
+    from flask_admin.helpers import set_current_view
+
+    app.config["BABEL_DEFAULT_LOCALE"] = "de"
+    request.getfixturevalue("babel")
+    domain = babel.CustomDomain()
+
+    view = mock.Mock()
+    view.admin.translations_path = None
+    other_view = mock.Mock()
+    other_view.admin.translations_path = str(tmp_path)
+
+    with app.test_request_context():
+        catalog = domain.get_translations()
+        assert domain.get_translations() is catalog
+        assert catalog.ugettext("Home") == "Start"
+
+        with force_locale("fr"):
+            assert domain.get_translations().ugettext("Home") == "Accueil"
+
+        assert domain.get_translations() is catalog
+
+        set_current_view(view)
+        assert domain.get_translations() is catalog
+
+        set_current_view(other_view)
+        other_catalog = domain.get_translations()
+        assert other_catalog is not catalog
+        assert other_catalog.ugettext("Home") == "Start"
+
+    with app.test_request_context():
+        assert domain.get_translations() is catalog
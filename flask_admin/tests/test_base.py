@@ -497,6 +497,116 @@ def test_add_links(app, admin):
     assert "TestMenuLink2" in data
 
 
+def test_menu_checks_memoized(app, admin):
+    calls = []
+
+    class CountingView(MockView):
+        def is_accessible(self):
+            calls.append(self.endpoint)
+            return super().is_accessible()
+
+    view = CountingView(name="Counting", category="Category")
+    admin.add_view(view)
+
+    with app.test_request_context("/admin/"):
+        menu_view = view.menu
+        assert menu_view is not None
+        assert menu_view.is_accessible()
+        assert menu_view.is_accessible()
+        assert admin.menu()[1].is_accessible()
+        assert calls == ["countingview"]
+
+    with app.test_request_context("/admin/"):
+        assert menu_view.is_accessible()
+        assert calls == ["countingview"] * 2
+
+
+def test_menu_cache(app, babel):
+    roles = {"role": "admin", "access": True}
+    admin = base.Admin(app, menu_cache_key=lambda: roles["role"])
+
+    class RoleView(MockView):
+        def is_accessible(self):
+            return roles["access"] and roles["role"] == "admin"
+
+    admin.add_view(RoleView(name="Secret"))
+    client = app.test_client()
+
+    assert "Secret" in client.get("/admin/").data.decode("utf-8")
+
+    # Cached for the same fingerprint
+    roles["access"] = False
+    assert "Secret" in client.get("/admin/").data.decode("utf-8")
+
+    roles["role"] = "user"
+    assert "Secret" not in client.get("/admin/").data.decode("utf-8")
+
+    roles["role"] = "admin"
+    admin.clear_menu_cache()
+    assert "Secret" not in client.get("/admin/").data.decode("utf-8")
+
+    # Adding menu items clears the cache
+    admin.add_link(MenuLink("NewLink", url="/new/"))
+    assert "NewLink" in client.get("/admin/").data.decode("utf-8")
+
+    # Menus are cached per mount point
+    rv = client.get("/admin/", environ_overrides={"SCRIPT_NAME": "/mounted"})
+    assert 'href="/mounted/admin/' in rv.data.decode("utf-8")
+    assert 'href="/mounted/' not in client.get("/admin/").data.decode("utf-8")
+
+    # Request hosts are not cached without host or subdomain routing
+    cached = len(admin._menu_cache)
+    client.get("/admin/", base_url="http://other.example/")
+    assert len(admin._menu_cache) == cached
+
+    # Least recently used menus are dropped, each page has two menus
+    admin.menu_cache_size = 4
+    for role in ("a", "b", "c"):
+        roles["role"] = role
+        client.get("/admin/")
+    assert [key[-1] for key in admin._menu_cache] == ["b", "b", "c", "c"]  # type: ignore[index]
+
+
+def test_template_bytecode_cache(app, babel, tmp_path):
+    cache_dir = tmp_path / "jinja"
+    admin = base.Admin(app, template_bytecode_cache=cache_dir)
+    admin.add_view(MockView())
+
+    assert app.jinja_env.bytecode_cache is not None
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["admin", "compile-templates"])
+    assert result.exit_code == 0, result.output
+    assert "Compiled" in result.output
+
+    cached = list(cache_dir.iterdir())
+    assert len(cached) > 1
+
+    # A new worker loads the compiled templates
+    env = app.jinja_env
+    env.cache.clear()
+    compiled = []
+    compile = env.compile
+
+    def record_compile(source, name=None, filename=None, *args, **kwargs):
+        compiled.append(name)
+        return compile(source, name, filename, *args, **kwargs)
+
+    env.compile = record_compile
+
+    rv = app.test_client().get("/admin/")
+    assert rv.status_code == 200
+    assert not [name for name in compiled if name and name.startswith("admin/")]
+    assert sorted(cache_dir.iterdir()) == sorted(cached)
+
+
+def test_compile_templates_without_cache(app, admin):
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["admin", "compile-templates"])
+    assert result.exit_code != 0
+    assert "template_bytecode_cache" in result.output
+
+
 def test_async_admin_view(app, admin):
     """
     Test admin with async view.
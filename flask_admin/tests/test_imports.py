@@ -0,0 +1,78 @@
+import subprocess
+import sys
+
+import pytest
+
+# Optional dependencies that are slow to import and only needed once a view
+# uses them
+HEAVY_MODULES = ("PIL", "tablib", "sqlalchemy_utils", "arrow", "boto3", "azure")
+
+
+def import_times(statement):
+    """
+    Run `statement` in a fresh interpreter and return the cumulative import
+    time in microseconds of every imported module, see `python -X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_import_flask_admin_is_lazy():
+    times = import_times("import flask_admin")
+
+    assert "flask_admin" in times
+    assert "flask_admin.base" not in times
+
+    times = import_times("from flask_admin import Admin")
+    assert "flask_admin.base" in times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "flask_admin.contrib.sqla",
+        "flask_admin.contrib.fileadmin",
+        "flask_admin.form.upload",
+    ],
+)
+def test_import_skips_heavy_dependencies(module):
+    times = import_times(f"import {module}")
+
+    imported = {
+        name: time
+        for name, time in times.items()
+        if name.split(".")[0] in HEAVY_MODULES
+    }
+    assert not imported, (
+        f"Importing {module} ({times[module] / 1000:.1f} ms) also imported "
+        f"{', '.join(sorted(imported))}"
+    )
+
+
+def test_optional_formatters_of_imported_libraries():
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import arrow\n"
+            "from flask_admin.contrib.sqla import typefmt\n"
+            "assert arrow.Arrow in typefmt.DEFAULT_FORMATTERS\n"
+            "assert arrow.Arrow in typefmt.EXPORT_FORMATTERS\n",
+        ],
+        check=True,
+    )
@@ -1,5 +1,12 @@
+import gc
+import json
+import logging
+import tracemalloc
+from unittest import mock
+
 import pytest
 from flask import Flask
+from flask import Response
 from werkzeug.middleware.dispatcher import DispatcherMiddleware
 from werkzeug.test import Client
 from wtforms import fields
@@ -8,8 +15,10 @@ from flask_admin import Admin
 from flask_admin import form
 from flask_admin._compat import iteritems
 from flask_admin._compat import itervalues
+from flask_admin.menu import MenuLink
 from flask_admin.model import base
 from flask_admin.model import filters
+from flask_admin.model import typefmt
 from flask_admin.model.template import macro
 from flask_admin.theme import Bootstrap4Theme
 
@@ -846,6 +855,303 @@ def test_list_row_actions(app, admin):
     assert "glyphicon-test" in data
 
 
+def test_type_formatters(app, admin):
+    class Flag(int):
+        pass
+
+    def legacy_formatter(view, value):
+        return f"legacy {value}"
+
+    with pytest.warns(UserWarning, match="additional `name` parameter"):
+        view = MockModelView(
+            Model,
+            column_type_formatters={
+                int: lambda view, value, name: f"int {name}",
+                Flag: lambda view, value, name: "flag",
+                str: legacy_formatter,
+            },
+        )
+        admin.add_view(view)
+
+    formatters = view.column_type_formatters
+    assert formatters is not None
+
+    # First matching formatter wins
+    assert view._get_type_formatter(formatters, Flag(1)) is (
+        view._get_type_formatter(formatters, 1)
+    )
+    assert view._get_type_formatter(formatters, 1.5) is None
+
+    model = Model(c1=1, c2="x", c3=Flag(2))
+    assert view._get_list_value(None, model, "col1", {}, formatters) == "int col1"
+    assert view._get_list_value(None, model, "col2", {}, formatters) == "legacy x"
+    assert view._get_list_value(None, model, "col3", {}, formatters) == "int col3"
+
+    # Formatters replaced after scaffolding are dispatched once
+    other_formatters = dict(formatters)
+    del other_formatters[str]
+    with mock.patch.object(
+        typefmt, "TypeFormatterDispatch", wraps=typefmt.TypeFormatterDispatch
+    ) as dispatch:
+        for _ in range(3):
+            view._get_list_value(None, model, "col1", {}, other_formatters)
+
+    assert dispatch.call_count == 1
+
+
+def test_list_row_urls(app, admin):
+    view = MockModelView(
+        Model,
+        data={1: Model("a b+c/d"), 2: Model(2)},
+        can_view_details=True,
+        page_size=1,
+        column_sortable_list=["col1", "col2"],
+    )
+    admin.add_view(view)
+
+    with app.test_request_context("/admin/model/?sort=1"):
+        get_row_url = view._get_row_url_builder()
+
+        for row_id in ("a b+c/d", "1&id=2", 2):
+            assert get_row_url(".edit_view", row_id, url="/admin/") == view.get_url(
+                ".edit_view", id=row_id, url="/admin/"
+            )
+            assert get_row_url(".details_view", row_id, id_arg="pk") == view.get_url(
+                ".details_view", pk=row_id
+            )
+
+    client = app.test_client()
+    rv = client.get("/admin/model/?sort=1")
+    assert rv.status_code == 200
+
+    data = rv.data.decode("utf-8")
+    assert (
+        'href="/admin/model/edit/?id=a+b%2Bc/d&amp;url=/admin/model/?sort%3D1"' in data
+    )
+    assert 'href="/admin/model/details/?id=2&amp;url=/admin/model/?sort%3D1"' in data
+    assert 'href="/admin/model/?page=1&amp;sort=1"' in data
+    assert 'href="/admin/model/?sort=0"' in data
+    assert 'href="/admin/model/?desc=1&amp;sort=1"' in data
+
+
+def test_list_row_urls_typed_converter(app, admin):
+    from flask_admin.model import template
+
+    @app.route("/other/<int:id>")
+    def other(id):
+        return str(id)
+
+    view = MockModelView(
+        Model,
+        data={1: Model(1), 2: Model(2)},
+        column_extra_row_actions=[
+            template.EndpointLinkRowAction("fa fa-x", "other"),
+        ],
+    )
+    admin.add_view(view)
+
+    client = app.test_client()
+    rv = client.get("/admin/model/")
+    assert rv.status_code == 200
+
+    data = rv.data.decode("utf-8")
+    assert 'href="/other/1"' in data
+    assert 'href="/other/2"' in data
+
+
+def test_list_pk_value_once_per_row(app, admin):
+    class PkCountingView(MockModelView):
+        pk_calls = 0
+
+        def get_pk_value(self, model):
+            self.pk_calls += 1
+            return super().get_pk_value(model)
+
+    view = PkCountingView(Model, can_view_details=True)
+    admin.add_view(view)
+
+    client = app.test_client()
+    rv = client.get("/admin/model/")
+    assert rv.status_code == 200
+    assert "/admin/model/details/?id=2" in rv.data.decode("utf-8")
+    assert view.pk_calls == 2
+
+
+def test_list_fragment(app, admin):
+    view = MockModelView(
+        Model,
+        column_list=["col1"],
+        column_sortable_list=["col1"],
+        column_filters=["col1"],
+        page_size=1,
+        list_fragments=True,
+    )
+    admin.add_view(view)
+
+    client = app.test_client()
+
+    rv = client.get("/admin/model/?sort=0")
+    data = rv.data.decode("utf-8")
+    assert rv.status_code == 200
+    assert '<div id="model-list-fragment">' in data
+    assert "admin/js/bs4_list.js" in data
+
+    rv = client.get("/admin/model/?sort=0&fragment=list")
+    data = rv.data.decode("utf-8")
+    assert rv.status_code == 200
+    assert "<html" not in data
+    assert "nav-tabs" not in data
+    assert "model-list" in data
+    assert 'class="pagination"' in data
+    # The fragment argument is not part of generated URLs
+    assert "/admin/model/?page=1&amp;sort=0" in data
+    assert "fragment" not in data
+
+
+def test_lazy_scaffolding(app, admin):
+    class CountingView(MockModelView):
+        refresh_calls = 0
+
+        def _refresh_cache(self):
+            self.refresh_calls += 1
+            super()._refresh_cache()
+
+    view = CountingView(Model, lazy_scaffolding=True)
+    admin.add_view(view)
+    assert view.refresh_calls == 0
+
+    warm_view = CountingView(Model, endpoint="warm", lazy_scaffolding=True)
+    admin.add_view(warm_view)
+    assert not hasattr(view, "_list_columns")
+
+    client = app.test_client()
+    rv = client.get("/admin/")
+    assert rv.status_code == 200
+    assert "/admin/model/" in rv.data.decode("utf-8")
+    assert view.refresh_calls == 0
+
+    rv = client.get("/admin/model/")
+    assert rv.status_code == 200
+    assert view.refresh_calls == 1
+
+    rv = client.get("/admin/model/")
+    assert view.refresh_calls == 1
+
+    assert warm_view.refresh_calls == 0
+    thread = admin.warm_up(background=True)
+    assert thread is not None
+    thread.join()
+    assert warm_view.refresh_calls == 1
+
+    assert admin.warm_up() is None
+    assert warm_view.refresh_calls == 1
+    assert view.refresh_calls == 1
+
+
+def test_admin_freeze(app, admin):
+    view = MockModelView(Model, lazy_scaffolding=True)
+    admin.add_view(view)
+
+    app.jinja_env.cache.clear()
+    try:
+        admin.freeze()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert hasattr(view, "_list_columns")
+
+    compiled = {name for _, name in app.jinja_env.cache.keys()}
+    assert "admin/model/list.html" in compiled
+    assert "admin/lib.html" in compiled
+    assert admin.theme.base_template in compiled
+
+    with pytest.raises(Exception, match="frozen"):
+        admin.add_view(MockModelView(Model, endpoint="other"))
+
+    with pytest.raises(Exception, match="frozen"):
+        admin.add_link(MenuLink("Link", url="/"))
+
+    client = app.test_client()
+    rv = client.get("/admin/model/")
+    assert rv.status_code == 200
+
+
+def test_startup_report(app, admin):
+    tracemalloc.start()
+    try:
+        admin.add_view(MockModelView(Model, endpoint="eager"))
+    finally:
+        tracemalloc.stop()
+    admin.add_view(MockModelView(Model, endpoint="lazy", lazy_scaffolding=True))
+
+    report = admin.get_startup_report()
+    assert [entry["endpoint"] for entry in report] == ["eager"]
+    assert report[0]["memory"] is not None
+    assert {"get_create_form", "get_edit_form", "get_filters"} <= set(
+        report[0]["steps"]
+    )
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["admin", "startup-report", "--json"])
+    assert result.exit_code == 0
+    report = json.loads(result.output)
+    assert {entry["endpoint"] for entry in report} == {"eager", "lazy"}
+    assert report[0]["time"] >= report[1]["time"]
+
+    result = runner.invoke(args=["admin", "startup-report", "--limit", "1"])
+    assert result.exit_code == 0
+    assert "get_create_form" in result.output
+
+
+def test_startup_report_log(app, admin, caplog):
+    admin.add_view(MockModelView(Model, endpoint="first"))
+    admin.add_view(MockModelView(Model, endpoint="second"))
+
+    client = app.test_client()
+    with caplog.at_level(logging.INFO, logger="flask-admin"):
+        client.get("/admin/")
+        client.get("/admin/")
+
+    records = [r for r in caplog.records if r.msg.startswith("Scaffolded")]
+    assert len(records) == 1
+    assert records[0].getMessage().startswith("Scaffolded 2 admin views")
+    assert {entry["endpoint"] for entry in records[0].startup_report} == {
+        "first",
+        "second",
+    }
+
+
+def test_list_streaming(app, admin):
+    view = MockModelView(Model, endpoint="rendered")
+    admin.add_view(view)
+
+    view = MockModelView(Model, endpoint="streamed", list_streaming=True)
+    admin.add_view(view)
+
+    client = app.test_client()
+
+    with app.test_request_context("/admin/streamed/"):
+        rv = view.index_view()
+        assert isinstance(rv, Response)
+        assert rv.is_streamed
+
+    rendered = client.get("/admin/rendered/").data.decode("utf-8")
+    streamed = client.get("/admin/streamed/").data.decode("utf-8")
+    assert streamed.rstrip().endswith("</html>")
+    assert streamed.count("<tr") == rendered.count("<tr") > 1
+
+    # Flash messages are consumed before the response starts
+    with client.session_transaction() as sess:
+        sess["_flashes"] = [("message", "Streamed message")]
+
+    rv = client.get("/admin/streamed/")
+    assert "Streamed message" in rv.data.decode("utf-8")
+
+    rv = client.get("/admin/streamed/")
+    assert "Streamed message" not in rv.data.decode("utf-8")
+
+
 @pytest.mark.parametrize(
     "url, age, msg",
     [